@@ -348,6 +348,11 @@ def setup_cli():
     transform_parser.add_argument(
         "--html-dir", type=str, help="Custom directory for HTML and JSON reports"
     )
+    transform_parser.add_argument(
+        "--force-html",
+        action="store_true",
+        help="Generate HTML reports even with --json and redirected stdout",
+    )
 
     # Parse arguments
     args = parser.parse_args()
@@ -140,6 +140,10 @@ class EnhancedLogger:
             self.console.print(
                 f"[{check_color}]{check_mark}[/{check_color}] {self.step}  {self.object_name}/{self.variant}  fields={fields_count}"
             )
+        elif self.step == "map" and event.get("status") == "up_to_date":
+            self.console.print(
+                f"[{check_color}]{check_mark}[/{check_color}] {self.step}  {self.object_name}/{self.variant}  up to date (use --force to regenerate)"
+            )
         elif self.step == "map":
             mapped_count = event.get("mapped", 0)
             unmapped_count = event.get("unmapped", 0)
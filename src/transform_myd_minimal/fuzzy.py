@@ -9,14 +9,25 @@ Contains all logic and algorithms for fuzzy matching including:
 - Threshold handling
 """
 
-import re
+from __future__ import annotations
+
 import unicodedata
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Sequence
+
+from rapidfuzz.distance import Levenshtein
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FuzzyConfig:
-    """Configuration for fuzzy matching behavior."""
+    """Configuration for fuzzy matching behavior.
+
+    Frozen: matchers derive settings from it once when they are created.
+    """
 
     enabled: bool = True
     threshold: float = 0.6  # Minimum similarity score for suggestions
@@ -27,8 +38,48 @@ class FuzzyConfig:
     use_jaro_winkler: bool = True
 
 
+# Byte tables for the normalizers: ASCII lowercase mapping, and every ASCII
+# byte that is not a letter or digit (dropped from field names)
+_ASCII_LOWER = bytes.maketrans(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZ", b"abcdefghijklmnopqrstuvwxyz"
+)
+_ASCII_NON_ALNUM = bytes(b for b in range(128) if not chr(b).isalnum())
+
+
+@lru_cache(maxsize=4096)
+def _normalize_field_name(name: str) -> str:
+    """Cached worker for FieldNormalizer.normalize_field_name."""
+    if not name:
+        return ""
+
+    # Remove accents and convert to ASCII
+    normalized = unicodedata.normalize("NFD", name)
+    ascii_bytes = normalized.encode("ascii", "ignore")
+
+    # Lowercase and drop special characters in a single translate pass
+    return ascii_bytes.translate(_ASCII_LOWER, _ASCII_NON_ALNUM).decode("ascii")
+
+
+@lru_cache(maxsize=4096)
+def _normalize_description(description: str) -> str:
+    """Cached worker for FieldNormalizer.normalize_description."""
+    if not description:
+        return ""
+
+    # Remove accents and convert to ASCII
+    normalized = unicodedata.normalize("NFD", description)
+    ascii_bytes = normalized.encode("ascii", "ignore")
+
+    # Lowercase, then strip and collapse whitespace runs to single spaces
+    return " ".join(ascii_bytes.translate(_ASCII_LOWER).decode("ascii").split())
+
+
 class FieldNormalizer:
-    """Normalizes field names and descriptions for matching."""
+    """Normalizes field names and descriptions for matching.
+
+    Results are memoized: the same names and descriptions are normalized
+    repeatedly across the exact, fuzzy, audit and synonym checks.
+    """
 
     @staticmethod
     def normalize_field_name(name: str) -> str:
@@ -38,17 +89,7 @@ class FieldNormalizer:
         - Convert to lowercase
         - Remove spaces, underscores, hyphens
         """
-        if not name:
-            return ""
-
-        # Remove accents and convert to ASCII
-        normalized = unicodedata.normalize("NFD", name)
-        ascii_text = normalized.encode("ascii", "ignore").decode("ascii")
-
-        # Convert to lowercase and remove special characters
-        cleaned = re.sub(r"[^a-zA-Z0-9]", "", ascii_text.lower())
-
-        return cleaned
+        return _normalize_field_name(name)
 
     @staticmethod
     def normalize_description(description: str) -> str:
@@ -58,17 +99,7 @@ class FieldNormalizer:
         - Convert to lowercase
         - Remove extra whitespace
         """
-        if not description:
-            return ""
-
-        # Remove accents and convert to ASCII
-        normalized = unicodedata.normalize("NFD", description)
-        ascii_text = normalized.encode("ascii", "ignore").decode("ascii")
-
-        # Convert to lowercase and normalize whitespace
-        cleaned = re.sub(r"\s+", " ", ascii_text.lower().strip())
-
-        return cleaned
+        return _normalize_description(description)
 
 
 class FuzzyMatcher:
@@ -76,36 +107,39 @@ class FuzzyMatcher:
 
     @staticmethod
     def levenshtein_distance(s1: str, s2: str) -> int:
-        """Calculate Levenshtein distance between two strings."""
-        if len(s1) < len(s2):
-            return FuzzyMatcher.levenshtein_distance(s2, s1)
-
-        if len(s2) == 0:
-            return len(s1)
+        """Calculate Levenshtein distance between two strings (rapidfuzz, in C)."""
+        return Levenshtein.distance(s1, s2)
 
-        previous_row = list(range(len(s2) + 1))
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
+    @staticmethod
+    def levenshtein_similarity(s1: str, s2: str) -> float:
+        """Calculate Levenshtein similarity (0.0 to 1.0).
 
-        return previous_row[-1]
+        1 - distance / max(len): 1.0 for two empty strings, 0.0 when only one
+        is empty.
+        """
+        return Levenshtein.normalized_similarity(s1, s2)
 
     @staticmethod
-    def levenshtein_similarity(s1: str, s2: str) -> float:
-        """Calculate Levenshtein similarity (0.0 to 1.0)."""
-        if not s1 and not s2:
-            return 1.0
-        if not s1 or not s2:
-            return 0.0
+    def levenshtein_similarity_matrix(
+        sources: Sequence[str], targets: Sequence[str]
+    ) -> np.ndarray:
+        """
+        Calculate Levenshtein similarity for every (source, target) pair.
 
-        max_len = max(len(s1), len(s2))
-        distance = FuzzyMatcher.levenshtein_distance(s1, s2)
-        return 1.0 - (distance / max_len)
+        Returns a float64 matrix with one row per source, holding the same
+        scores as levenshtein_similarity but computed in a single C call.
+        """
+        # numpy comes in with rapidfuzz.process; import it only when needed
+        import numpy as np
+        from rapidfuzz.process import cdist
+
+        return cdist(
+            sources,
+            targets,
+            scorer=Levenshtein.normalized_similarity,
+            dtype=np.float64,
+            workers=-1,
+        )
 
     @staticmethod
     def jaro_winkler_similarity(s1: str, s2: str) -> float:
@@ -128,6 +162,40 @@ class FuzzyMatcher:
 
         return jaro_sim + (0.1 * prefix_len * (1 - jaro_sim))
 
+    @staticmethod
+    def jaro_winkler_bound_matrix(
+        sources: Sequence[str], targets: Sequence[str]
+    ) -> np.ndarray:
+        """
+        Upper bound of jaro_winkler_similarity for every (source, target) pair.
+
+        rapidfuzz's compiled Jaro finds the same matches as _jaro_similarity
+        but halves the transposition count with integer division, so its
+        score is never lower (and equal whenever the count is even). Adding
+        the same Winkler prefix boost keeps that ordering. Matchers use the
+        bound to skip exact scoring for pairs that cannot pass.
+        """
+        import numpy as np
+        from rapidfuzz.distance import Jaro
+        from rapidfuzz.process import cdist
+
+        jaro = cdist(
+            sources, targets, scorer=Jaro.similarity, dtype=np.float64, workers=-1
+        )
+
+        # Common prefix length (max 4) from the first four code points; the
+        # padding values differ per side so short strings never match on them
+        def first_chars(strings, pad):
+            chars = np.full((len(strings), 4), pad, dtype=np.int64)
+            for i, string in enumerate(strings):
+                chars[i, : min(len(string), 4)] = [ord(c) for c in string[:4]]
+            return chars
+
+        same = first_chars(sources, -1)[:, None, :] == first_chars(targets, -2)
+        prefix_len = np.cumprod(same, axis=2).sum(axis=2)
+
+        return jaro + 0.1 * prefix_len * (1 - jaro)
+
     @staticmethod
     def _jaro_similarity(s1: str, s2: str) -> float:
         """Calculate Jaro similarity."""
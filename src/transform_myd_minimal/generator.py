@@ -337,7 +337,7 @@ def generate_column_map_yaml(
     timestamp = datetime.now().strftime("%Y%m%d %H%M")
 
     # Import here to avoid circular imports
-    from .main import create_advanced_column_mapping
+    from .main import _column_values, create_advanced_column_mapping
 
     # Create advanced mapping with detailed results (for YAML generation only, without central memory)
     fuzzy_config = FuzzyConfig(
@@ -500,11 +500,12 @@ def generate_column_map_yaml(
         if result.target_field
     }
 
-    for _, target_row in target_fields.iterrows():
-        target_name = target_row["field_name"]
+    for target_name, target_desc in zip(
+        _column_values(target_fields, "field_name"),
+        _column_values(target_fields, "field_description"),
+        strict=True,
+    ):
         if target_name not in mapped_targets:
-            target_desc = target_row["field_description"]
-
             # Use smart logic to determine if this should be a constant field
             if is_constant_field(target_name, target_desc):
                 # This appears to be an operational flag or control field
@@ -551,17 +552,24 @@ def generate_column_map_yaml(
             ]
         )
 
-    # Add advanced matching statistics
-    yaml_content.append("#matching_statistics:")
-    yaml_content.append(f"#  total_sources: {len(source_fields)}")
-    yaml_content.append(f"#  total_targets: {len(target_fields)}")
-    yaml_content.append(f"#  exact_matches: {len(exact_matches)}")
-    yaml_content.append(f"#  fuzzy_matches: {len(fuzzy_matches)}")
-    yaml_content.append(f"#  unmapped_sources: {len(unmapped_sources)}")
-    yaml_content.append(
-        f"#  mapping_coverage: {((len(exact_matches) + len(fuzzy_matches)) / len(source_fields) * 100):.1f}%"
+    # Add advanced matching statistics (counted once; no coverage without
+    # sources)
+    n_sources = len(source_fields)
+    n_exact = len(exact_matches)
+    n_fuzzy = len(fuzzy_matches)
+    coverage = (n_exact + n_fuzzy) / n_sources * 100 if n_sources else 0.0
+    yaml_content.extend(
+        [
+            "#matching_statistics:",
+            f"#  total_sources: {n_sources}",
+            f"#  total_targets: {len(target_fields)}",
+            f"#  exact_matches: {n_exact}",
+            f"#  fuzzy_matches: {n_fuzzy}",
+            f"#  unmapped_sources: {len(unmapped_sources)}",
+            f"#  mapping_coverage: {coverage:.1f}%",
+            "#",
+        ]
     )
-    yaml_content.append("#")
 
     return "\n".join(yaml_content)
 
@@ -734,6 +742,9 @@ def generate_migration_mappings_yaml(
         "mappings": [],
     }
 
+    # Import here to avoid circular imports
+    from .main import _column_values, _first_descriptions
+
     # If mapping results are provided, use them; otherwise fall back to basic implementation
     if mapping_results:
         exact_matches = mapping_results.get("exact_matches", [])
@@ -744,19 +755,21 @@ def generate_migration_mappings_yaml(
         source_fields = mapping_results.get("source_fields")
         target_fields = mapping_results.get("target_fields")
 
+        # First-row description per field name, instead of a mask per match
+        target_descs = (
+            _first_descriptions(target_fields) if target_fields is not None else {}
+        )
+        source_descs = (
+            _first_descriptions(source_fields) if source_fields is not None else {}
+        )
+
         # Create mapping entries based on actual matching results
         processed_source_fields = set()
 
         # Process exact and fuzzy matches first
         for match in exact_matches + fuzzy_matches:
             # Get target description from target_fields
-            target_desc = ""
-            if target_fields is not None:
-                target_row = target_fields[
-                    target_fields["field_name"] == match.target_field
-                ]
-                if not target_row.empty:
-                    target_desc = target_row.iloc[0].get("field_description", "")
+            target_desc = target_descs.get(match.target_field, "")
 
             mapping_entry = {
                 "target_field_name": match.target_field,
@@ -782,12 +795,8 @@ def generate_migration_mappings_yaml(
             target_desc = (
                 match.target_description if hasattr(match, "target_description") else ""
             )
-            if not target_desc and target_fields is not None:
-                target_row = target_fields[
-                    target_fields["field_name"] == match.target_field
-                ]
-                if not target_row.empty:
-                    target_desc = target_row.iloc[0].get("field_description", "")
+            if not target_desc:
+                target_desc = target_descs.get(match.target_field, "")
 
             mapping_entry = {
                 "target_field_name": match.target_field,
@@ -833,13 +842,7 @@ def generate_migration_mappings_yaml(
                 continue  # Skip if already processed
 
             # Get source description from source_fields
-            source_desc = ""
-            if source_fields is not None:
-                source_row = source_fields[
-                    source_fields["field_name"] == source_field_name
-                ]
-                if not source_row.empty:
-                    source_desc = source_row.iloc[0].get("field_description", "")
+            source_desc = source_descs.get(source_field_name, "")
 
             mapping_entry = {
                 "target_field_name": "",
@@ -857,13 +860,16 @@ def generate_migration_mappings_yaml(
         # Fallback to basic implementation if no mapping results provided
         source_fields = df[df["field"] == "Source"].copy()
 
-        for _, source_row in source_fields.iterrows():
+        for source_name, source_desc in zip(
+            _column_values(source_fields, "field_name", ""),
+            _column_values(source_fields, "field_description", ""),
+            strict=True,
+        ):
             mapping_entry = {
                 "target_field_name": "",
-                "source_field_name": source_row.get("field_name", ""),
+                "source_field_name": source_name,
                 "target_field_description": "",
-                "source_field_description": source_row.get("field_description", "")
-                or "none",
+                "source_field_description": source_desc or "none",
                 "target_table": "",
                 "map_status": "pending",
                 "map_confidence": 0.0,
@@ -901,14 +907,17 @@ def generate_migration_mappings_yaml(
 
                 # Check for manual mappings that may have been overridden by exact matches
                 # This would happen if there were rules for the same source field
+                exact_by_target = {}
+                for exact_match in exact_matches:
+                    exact_by_target.setdefault(exact_match.target_field, []).append(
+                        exact_match
+                    )
                 overridden_manual = []
                 for manual_match in central_manual_matches:
                     # Check if this manual mapping's target was also matched by an exact match of a different source
-                    for exact_match in exact_matches:
-                        if (
-                            exact_match.target_field == manual_match.target_field
-                            and exact_match.source_field != manual_match.source_field
-                        ):
+                    same_target = exact_by_target.get(manual_match.target_field, [])
+                    for exact_match in same_target:
+                        if exact_match.source_field != manual_match.source_field:
                             overridden_manual.append((manual_match, exact_match))
 
                 if overridden_manual:
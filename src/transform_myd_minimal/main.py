@@ -9,17 +9,22 @@ Contains the entrypoint and orchestration of the different modules including:
 - Core data classes and structures
 """
 
+from __future__ import annotations
+
 import json
+import re
 import sys
-from collections import OrderedDict
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from dataclasses import field as dc_field
 from datetime import datetime
+from functools import lru_cache
+from itertools import compress
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
-import pandas as pd
 import yaml
-from pandas.api.types import infer_dtype
 
 from .cli import setup_cli
 from .fuzzy import FieldNormalizer, FuzzyConfig, FuzzyMatcher
@@ -32,10 +37,35 @@ from .schema import (
     validate_mapping,
 )
 from .synonym import SynonymMatcher
+from .yaml_utils import YamlLoader, dump_yaml
+
+# pandas and the reporting module (which pulls in pandas/numpy) are imported
+# inside the functions that need them, so `--help` and early exits stay fast
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
 
 # Initialize logger for this module
 logger = get_logger(__name__)
 
+# Base name of a template header, i.e. the part before any "(k/*)" annotation
+_BASE_NAME_RE = re.compile(r"^([^()]+)")
+
+# Runs of characters that are not ASCII letters or digits
+_NON_ALNUM_RUN_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+
+@lru_cache(maxsize=4096)
+def _normalize_header(s: str) -> str:
+    """Normalize a header for F03 matching.
+
+    lower → non-alphanumeric runs to one space → strip. Cached because the
+    same headers and synonym variants are normalized for every target.
+    """
+    if not s:
+        return ""
+    return _NON_ALNUM_RUN_RE.sub(" ", s.lower()).strip()
+
 
 # Configure YAML to maintain dictionary order
 def represent_ordereddict(dumper, data):
@@ -44,8 +74,68 @@ def represent_ordereddict(dumper, data):
 
 yaml.add_representer(OrderedDict, represent_ordereddict)
 
+# orjson is an optional accelerator for the large report JSON dumps
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file; keyed on (path, mtime, size) so edits invalidate it.
+
+    The file is handed to the loader as bytes; libyaml decodes UTF-8 itself.
+    """
+    with open(path_str, "rb") as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+
+def _load_yaml(path: Path) -> Any:
+    """Load a YAML file through the parse cache.
 
-@dataclass
+    The returned object is shared between callers and must be treated as
+    read-only.
+    """
+    st = path.stat()
+    return _load_yaml_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+def _dumps_json(data: Any, pretty: bool = True) -> bytes:
+    """Serialize report data to UTF-8 JSON (orjson when installed).
+
+    ``pretty=False`` gives compact output for machine consumers.
+    """
+    if orjson is not None:
+        # Profiles carry numpy scalars, which stdlib json accepts as floats
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _posix(path) -> str:
+    """Render a path with forward slashes for logs and report metadata."""
+    return Path(path).as_posix()
+
+
+def _column_values(df: pd.DataFrame, column: str, default: Any = None) -> list:
+    """Return a column as a plain list.
+
+    Without ``default`` a missing column raises ``KeyError`` (as row access
+    would); with it, every row gets ``default``. Empty frames give ``[]``.
+    """
+    if column in df.columns:
+        return df[column].tolist()
+    if default is None and len(df):
+        raise KeyError(column)
+    return [default] * len(df)
+
+
+@dataclass(slots=True)
 class FieldMatchResult:
     """Result of a field matching operation."""
 
@@ -59,7 +149,7 @@ class FieldMatchResult:
     algorithm: Optional[str] = None  # "levenshtein", "jaro_winkler" for fuzzy matches
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SkipRule:
     """Represents a skip rule from central mapping memory."""
 
@@ -69,7 +159,7 @@ class SkipRule:
     comment: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ManualMapping:
     """Represents a manual mapping rule from central mapping memory."""
 
@@ -80,7 +170,7 @@ class ManualMapping:
     comment: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CentralMappingMemory:
     """Central mapping memory configuration."""
 
@@ -88,6 +178,10 @@ class CentralMappingMemory:
     global_manual_mappings: List[ManualMapping]
     table_specific: Dict[str, Dict[str, List]]
     synonyms: Dict[str, List[str]]
+    # Effective (global + table-specific) rules per table key, built on demand
+    _effective_rules: Dict[str, Tuple[List[SkipRule], List[ManualMapping]]] = dc_field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
 
 class AdvancedFieldMatcher:
@@ -98,6 +192,13 @@ class AdvancedFieldMatcher:
         self.normalizer = FieldNormalizer()
         self.fuzzy_matcher = FuzzyMatcher()
         self.synonym_matcher = SynonymMatcher()
+        # Reported on fuzzy and audit matches: the higher-weighted algorithm
+        self._algorithm = (
+            "levenshtein"
+            if self.fuzzy_config.levenshtein_weight
+            > self.fuzzy_config.jaro_winkler_weight
+            else "jaro_winkler"
+        )
 
     def match_fields(
         self, source_fields: pd.DataFrame, target_fields: pd.DataFrame
@@ -109,48 +210,104 @@ class AdvancedFieldMatcher:
         - matches: List of actual field mappings (exact and non-conflicting fuzzy)
         - audit_matches: List of fuzzy matches to already exact-mapped targets (for audit)
         """
+        import numpy as np
+
+        # Pull the columns out once (iterating plain lists avoids a Series per
+        # row) and normalize each source once for both passes:
+        # (name, description, normalized name, normalized description)
+        normalize_name = self.normalizer.normalize_field_name
+        normalize_desc = self.normalizer.normalize_description
+        source_rows = [
+            (name, desc, normalize_name(name), normalize_desc(desc))
+            for name, desc in zip(
+                _column_values(source_fields, "field_name"),
+                _column_values(source_fields, "field_description"),
+                strict=True,
+            )
+        ]
+
         # Create normalized target lookup
-        target_lookup = {}
-        for _, target_row in target_fields.iterrows():
-            target_name = target_row["field_name"]
-            target_desc = target_row["field_description"]
-            target_lookup[target_name] = {
+        target_lookup = {
+            target_name: {
                 "description": target_desc,
-                "normalized_name": self.normalizer.normalize_field_name(target_name),
-                "normalized_desc": self.normalizer.normalize_description(target_desc),
-                "is_key": target_row.get("field_is_key", False),
-                "is_mandatory": target_row.get("field_is_mandatory", False),
+                "normalized_name": normalize_name(target_name),
+                "normalized_desc": normalize_desc(target_desc),
+                "is_key": is_key,
+                "is_mandatory": is_mandatory,
             }
+            for target_name, target_desc, is_key, is_mandatory in zip(
+                _column_values(target_fields, "field_name"),
+                _column_values(target_fields, "field_description"),
+                _column_values(target_fields, "field_is_key", False),
+                _column_values(target_fields, "field_is_mandatory", False),
+                strict=True,
+            )
+        }
 
-        # First pass: Find all exact matches
-        exact_mapped_targets = set()
-        results = []
+        # Targets by position (the score matrix columns), with their
+        # normalized names and descriptions as parallel columns
+        target_items = list(target_lookup.items())
+        target_norm_names = [info["normalized_name"] for _, info in target_items]
+        target_norm_descs = [info["normalized_desc"] for _, info in target_items]
+
+        # Batch scores for all source/target pairs (rows follow source_rows,
+        # columns follow target_items)
+        score_matrices = {}
+        if self.fuzzy_config.enabled:
+            score_matrices = self._batch_scores(
+                source_rows, target_norm_names, target_norm_descs
+            )
 
-        for _, source_row in source_fields.iterrows():
-            source_name = source_row["field_name"]
-            source_desc = source_row["field_description"]
+        # Targets by name and by normalized name; the first target with a
+        # normalized name wins exact lookups
+        target_positions = {name: i for i, (name, _) in enumerate(target_items)}
+        positions_by_norm = {}
+        for position, norm_name in enumerate(target_norm_names):
+            positions_by_norm.setdefault(norm_name, []).append(position)
+        targets_by_norm_name = {
+            norm_name: target_items[positions[0]][0]
+            for norm_name, positions in positions_by_norm.items()
+        }
+
+        # First pass: Find all exact matches, marking their target positions
+        exact_mask = np.zeros(len(target_items), dtype=bool)
+        results = []
+        matched_sources = set()  # source names that already have a result
 
+        for source_name, source_desc, source_norm_name, source_norm_desc in source_rows:
             exact_match = self._find_exact_match(
-                source_name, source_desc, target_lookup
+                source_name,
+                source_desc,
+                source_norm_name,
+                source_norm_desc,
+                target_lookup,
+                targets_by_norm_name,
             )
             if exact_match:
                 results.append(exact_match)
-                exact_mapped_targets.add(exact_match.target_field)
+                matched_sources.add(source_name)
+                exact_mask[target_positions[exact_match.target_field]] = True
 
         # Second pass: Find fuzzy/synonym matches excluding already exact-mapped targets
         audit_matches = []
 
-        for _, source_row in source_fields.iterrows():
-            source_name = source_row["field_name"]
-            source_desc = source_row["field_description"]
-
-            # Skip if we already found an exact match for this source
-            if any(r.source_field == source_name for r in results):
+        for row, source in enumerate(source_rows):
+            source_name, source_desc, source_norm_name, source_norm_desc = source
+            # Skip if we already have a result for this source name
+            if source_name in matched_sources:
                 continue
-
-            # Find best non-exact match
-            fuzzy_match = self._find_fuzzy_match(
-                source_name, source_desc, target_lookup, exact_mapped_targets
+            matched_sources.add(source_name)
+
+            # Best non-exact match plus any audit match for this source
+            fuzzy_match, audit_match = self._find_fuzzy_and_audit_match(
+                source_name,
+                source_desc,
+                source_norm_name,
+                source_norm_desc,
+                target_items,
+                positions_by_norm,
+                exact_mask,
+                {kind: matrix[row] for kind, matrix in score_matrices.items()},
             )
             if fuzzy_match:
                 results.append(fuzzy_match)
@@ -166,224 +323,318 @@ class AdvancedFieldMatcher:
                         source_description=source_desc,
                     )
                 )
-
-            # Check for audit matches (fuzzy matches to exact-mapped targets)
-            audit_match = self._find_audit_match(
-                source_name, source_desc, target_lookup, exact_mapped_targets
-            )
             if audit_match:
                 audit_matches.append(audit_match)
 
         return results, audit_matches
 
     def _find_exact_match(
-        self, source_name: str, source_desc: str, target_lookup: Dict
-    ) -> Optional[FieldMatchResult]:
-        """Find exact match for a source field."""
-        source_norm_name = self.normalizer.normalize_field_name(source_name)
-        source_norm_desc = self.normalizer.normalize_description(source_desc)
-
-        # Strategy 1: Exact match on normalized field names
-        for target_name, target_info in target_lookup.items():
-            if source_norm_name == target_info["normalized_name"]:
-                # Additional check: if descriptions are available, they should also match or be similar
-                if source_norm_desc and target_info["normalized_desc"]:
-                    if source_norm_desc == target_info["normalized_desc"]:
-                        confidence = 1.0  # Perfect match
-                    else:
-                        confidence = 0.95  # Name matches, description differs slightly
-                else:
-                    confidence = 0.95  # Name matches, no description to verify
-
-                return FieldMatchResult(
-                    source_field=source_name,
-                    target_field=target_name,
-                    confidence_score=confidence,
-                    match_type="exact",
-                    reason="Exacte match op genormaliseerde veldnaam",
-                    source_description=source_desc,
-                    target_description=target_info["description"],
-                )
-        return None
-
-    def _find_fuzzy_match(
         self,
         source_name: str,
         source_desc: str,
+        source_norm_name: str,
+        source_norm_desc: str,
         target_lookup: Dict,
-        exact_mapped_targets: set,
+        targets_by_norm_name: Dict[str, str],
     ) -> Optional[FieldMatchResult]:
-        """Find fuzzy/synonym match for a source field, excluding exact-mapped targets."""
-        if not self.fuzzy_config.enabled:
+        """Find exact match for a source field (with its normalized name/desc)."""
+        # Strategy 1: Exact match on normalized field names (first target wins)
+        target_name = targets_by_norm_name.get(source_norm_name)
+        if target_name is None:
             return None
+        target_info = target_lookup[target_name]
 
-        source_norm_name = self.normalizer.normalize_field_name(source_name)
-        source_norm_desc = self.normalizer.normalize_description(source_desc)
-
-        best_match = None
-        best_score = 0.0
-
-        for target_name, target_info in target_lookup.items():
-            # Skip if this target is already exact-mapped
-            if target_name in exact_mapped_targets:
-                continue
-
-            # Check for synonym match first
-            if self.synonym_matcher.is_synonym_match(source_name, target_name):
-                return FieldMatchResult(
-                    source_field=source_name,
-                    target_field=target_name,
-                    confidence_score=0.85,
-                    match_type="synoniem",
-                    reason="Synoniem match gevonden",
-                    source_description=source_desc,
-                    target_description=target_info["description"],
-                )
-
-            # Fuzzy matching
-            if self.fuzzy_config.use_levenshtein or self.fuzzy_config.use_jaro_winkler:
-                # Calculate name similarity
-                name_sim_lev = (
-                    self.fuzzy_matcher.levenshtein_similarity(
-                        source_norm_name, target_info["normalized_name"]
-                    )
-                    if self.fuzzy_config.use_levenshtein
-                    else 0.0
-                )
-
-                name_sim_jw = (
-                    self.fuzzy_matcher.jaro_winkler_similarity(
-                        source_norm_name, target_info["normalized_name"]
-                    )
-                    if self.fuzzy_config.use_jaro_winkler
-                    else 0.0
-                )
-
-                # Combined name similarity
-                name_similarity = (
-                    name_sim_lev * self.fuzzy_config.levenshtein_weight
-                    + name_sim_jw * self.fuzzy_config.jaro_winkler_weight
-                )
-
-                # Description similarity (if available)
-                desc_similarity = 0.0
-                if source_norm_desc and target_info["normalized_desc"]:
-                    desc_sim_lev = (
-                        self.fuzzy_matcher.levenshtein_similarity(
-                            source_norm_desc, target_info["normalized_desc"]
-                        )
-                        if self.fuzzy_config.use_levenshtein
-                        else 0.0
-                    )
-
-                    desc_sim_jw = (
-                        self.fuzzy_matcher.jaro_winkler_similarity(
-                            source_norm_desc, target_info["normalized_desc"]
-                        )
-                        if self.fuzzy_config.use_jaro_winkler
-                        else 0.0
-                    )
-
-                    desc_similarity = (
-                        desc_sim_lev * self.fuzzy_config.levenshtein_weight
-                        + desc_sim_jw * self.fuzzy_config.jaro_winkler_weight
-                    )
-
-                # Combined score: 70% name, 30% description
-                if source_norm_desc and target_info["normalized_desc"]:
-                    combined_score = 0.7 * name_similarity + 0.3 * desc_similarity
-                else:
-                    combined_score = name_similarity
-
-                if (
-                    combined_score >= self.fuzzy_config.threshold
-                    and combined_score > best_score
-                ):
-                    best_score = combined_score
-                    algorithm = (
-                        "levenshtein"
-                        if self.fuzzy_config.levenshtein_weight
-                        > self.fuzzy_config.jaro_winkler_weight
-                        else "jaro_winkler"
-                    )
-                    best_match = FieldMatchResult(
-                        source_field=source_name,
-                        target_field=target_name,
-                        confidence_score=combined_score,
-                        match_type="fuzzy",
-                        reason=f"Fuzzy match (similarity: {combined_score:.2f})",
-                        source_description=source_desc,
-                        target_description=target_info["description"],
-                        algorithm=algorithm,
-                    )
-
-        return best_match
+        # Additional check: if descriptions are available, they should also match or be similar
+        if source_norm_desc and target_info["normalized_desc"]:
+            if source_norm_desc == target_info["normalized_desc"]:
+                confidence = 1.0  # Perfect match
+            else:
+                confidence = 0.95  # Name matches, description differs slightly
+        else:
+            confidence = 0.95  # Name matches, no description to verify
+
+        return FieldMatchResult(
+            source_field=source_name,
+            target_field=target_name,
+            confidence_score=confidence,
+            match_type="exact",
+            reason="Exacte match op genormaliseerde veldnaam",
+            source_description=source_desc,
+            target_description=target_info["description"],
+        )
 
-    def _find_audit_match(
+    def _find_fuzzy_and_audit_match(
         self,
         source_name: str,
         source_desc: str,
-        target_lookup: Dict,
-        exact_mapped_targets: set,
-    ) -> Optional[FieldMatchResult]:
-        """Find fuzzy matches to exact-mapped targets for audit purposes."""
-        if not self.fuzzy_config.enabled or not exact_mapped_targets:
-            return None
+        source_norm_name: str,
+        source_norm_desc: str,
+        target_items: List[Tuple[str, Dict]],
+        positions_by_norm: Dict[str, List[int]],
+        exact_mask: np.ndarray,
+        row_scores: Dict[str, np.ndarray],
+    ) -> Tuple[Optional[FieldMatchResult], Optional[FieldMatchResult]]:
+        """Find the best fuzzy/synonym match and the best audit match.
+
+        Targets that are not exact-mapped are candidates for the fuzzy match;
+        exact-mapped targets (exact_mask, by target position) only feed the
+        audit match (name similarity). target_items and positions_by_norm
+        index the targets by position; row_scores holds this source's row of
+        each _batch_scores matrix.
+        """
+        import numpy as np
 
-        source_norm_name = self.normalizer.normalize_field_name(source_name)
+        if not self.fuzzy_config.enabled:
+            return None, None
+
+        config = self.fuzzy_config
+        use_similarity = config.use_levenshtein or config.use_jaro_winkler
+        # A synonym hit on the first non-exact-mapped target settles the fuzzy
+        # match; targets with the same normalized name count as synonyms
+        synonym_position = min(
+            (
+                position
+                for norm in self.synonym_matcher.synonyms_of(source_norm_name)
+                | {source_norm_name}
+                for position in positions_by_norm.get(norm, ())
+                if not exact_mask[position]
+            ),
+            default=None,
+        )
+
+        # Only pairs whose batch upper bound can reach the threshold need
+        # exact scoring (the small margin absorbs float rounding)
+        audit_positions = np.flatnonzero(
+            exact_mask & (row_scores["name_bound"] + 1e-9 >= config.threshold)
+        )
+        fuzzy_positions = np.flatnonzero(
+            ~exact_mask & (row_scores["combined_bound"] + 1e-9 >= config.threshold)
+        )
+        if synonym_position is not None or not use_similarity:
+            fuzzy_positions = fuzzy_positions[:0]
 
         best_match = None
-        best_score = 0.0
+        audit_match = None
+
+        if synonym_position is not None:
+            target_name, target_info = target_items[synonym_position]
+            best_match = FieldMatchResult(
+                source_field=source_name,
+                target_field=target_name,
+                confidence_score=0.85,
+                match_type="synoniem",
+                reason="Synoniem match gevonden",
+                source_description=source_desc,
+                target_description=target_info["description"],
+            )
 
-        # Only check exact-mapped targets
-        for target_name in exact_mapped_targets:
-            target_info = target_lookup[target_name]
+        def name_score(position):
+            return self._weighted_similarity(
+                row_scores,
+                "name_lev",
+                position,
+                source_norm_name,
+                target_items[position][1]["normalized_name"],
+            )
 
-            # Calculate similarity to this exact-mapped target
-            name_sim_lev = (
-                self.fuzzy_matcher.levenshtein_similarity(
-                    source_norm_name, target_info["normalized_name"]
-                )
-                if self.fuzzy_config.use_levenshtein
-                else 0.0
+        def combined_score(position):
+            name_similarity = name_score(position)
+            # Description similarity (if available)
+            if not row_scores["has_desc"].item(position):
+                return name_similarity
+            desc_similarity = self._weighted_similarity(
+                row_scores,
+                "desc_lev",
+                position,
+                source_norm_desc,
+                target_items[position][1]["normalized_desc"],
             )
+            # Combined score: 70% name, 30% description
+            return 0.7 * name_similarity + 0.3 * desc_similarity
 
-            name_sim_jw = (
-                self.fuzzy_matcher.jaro_winkler_similarity(
-                    source_norm_name, target_info["normalized_name"]
-                )
-                if self.fuzzy_config.use_jaro_winkler
-                else 0.0
+        # Audit: fuzzy match to an already exact-mapped target
+        audit_score, audit_position = self._best_scored_position(
+            audit_positions, row_scores["name_bound"], name_score
+        )
+        best_score, best_position = self._best_scored_position(
+            fuzzy_positions, row_scores["combined_bound"], combined_score
+        )
+
+        if audit_position is not None:
+            target_name, target_info = target_items[audit_position]
+            audit_match = FieldMatchResult(
+                source_field=source_name,
+                target_field=target_name,
+                confidence_score=audit_score,
+                match_type="audit",
+                reason=f"Fuzzy match to exact-mapped target (audit, similarity: {audit_score:.2f})",
+                source_description=source_desc,
+                target_description=target_info["description"],
+                algorithm=self._algorithm,
             )
 
-            name_similarity = (
-                name_sim_lev * self.fuzzy_config.levenshtein_weight
-                + name_sim_jw * self.fuzzy_config.jaro_winkler_weight
+        if best_position is not None:
+            target_name, target_info = target_items[best_position]
+            best_match = FieldMatchResult(
+                source_field=source_name,
+                target_field=target_name,
+                confidence_score=best_score,
+                match_type="fuzzy",
+                reason=f"Fuzzy match (similarity: {best_score:.2f})",
+                source_description=source_desc,
+                target_description=target_info["description"],
+                algorithm=self._algorithm,
             )
 
-            if (
-                name_similarity >= self.fuzzy_config.threshold
-                and name_similarity > best_score
+        return best_match, audit_match
+
+    def _best_scored_position(
+        self,
+        positions: np.ndarray,
+        bounds: np.ndarray,
+        score: Callable[[int], float],
+    ) -> Tuple[float, Optional[int]]:
+        """Best score(position) reaching the threshold, and its position.
+
+        Candidates are scored in descending order of their upper bound, so
+        scoring stops as soon as no remaining bound can reach the best score.
+        Ties go to the lowest position, as in a left-to-right scan.
+        """
+        import numpy as np
+
+        threshold = self.fuzzy_config.threshold
+        best_score = 0.0
+        best_position = None
+        order = positions[np.argsort(-bounds[positions], kind="stable")]
+        for position in order.tolist():
+            if bounds.item(position) + 1e-9 < best_score:
+                break
+            candidate = score(position)
+            if candidate < threshold:
+                continue
+            if candidate > best_score or (
+                candidate == best_score
+                and best_position is not None
+                and position < best_position
             ):
-                best_score = name_similarity
-                algorithm = (
-                    "levenshtein"
-                    if self.fuzzy_config.levenshtein_weight
-                    > self.fuzzy_config.jaro_winkler_weight
-                    else "jaro_winkler"
-                )
-                best_match = FieldMatchResult(
-                    source_field=source_name,
-                    target_field=target_name,
-                    confidence_score=name_similarity,
-                    match_type="audit",
-                    reason=f"Fuzzy match to exact-mapped target (audit, similarity: {name_similarity:.2f})",
-                    source_description=source_desc,
-                    target_description=target_info["description"],
-                    algorithm=algorithm,
-                )
+                best_score = candidate
+                best_position = position
+        return best_score, best_position
+
+    def _weighted_similarity(
+        self,
+        row_scores: Dict[str, np.ndarray],
+        lev_kind: str,
+        position: int,
+        source_norm: str,
+        target_norm: str,
+    ) -> float:
+        """Weighted Levenshtein + Jaro-Winkler similarity for one pair."""
+        config = self.fuzzy_config
+        sim_lev = row_scores[lev_kind].item(position) if config.use_levenshtein else 0.0
+        sim_jw = (
+            self.fuzzy_matcher.jaro_winkler_similarity(source_norm, target_norm)
+            if config.use_jaro_winkler
+            else 0.0
+        )
+        return sim_lev * config.levenshtein_weight + sim_jw * config.jaro_winkler_weight
 
-        return best_match
+    def _batch_scores(
+        self,
+        source_rows: List[Tuple[Any, Any, str, str]],
+        target_names: List[str],
+        target_descs: List[str],
+    ) -> Dict[str, Any]:
+        """
+        Score every source/target pair at once with rapidfuzz's C batch calls.
+
+        target_names and target_descs are the normalized target names and
+        descriptions. Returns numpy matrices (rows follow source_rows, columns
+        follow the targets): "has_desc" marks pairs where both sides have a
+        description, "name_lev"/"desc_lev" hold Levenshtein similarities and
+        "name_bound"/"combined_bound" hold upper bounds of the name score and
+        of the 70/30 name/description score (exact when Jaro-Winkler is off).
+        Description scores are only computed for pairs that have both
+        descriptions and are zero elsewhere.
+        """
+        import numpy as np
+
+        config = self.fuzzy_config
+        source_names = [source[2] for source in source_rows]
+        source_descs = [source[3] for source in source_rows]
+
+        source_has_desc = np.array([bool(d) for d in source_descs], dtype=bool)
+        target_has_desc = np.array([bool(d) for d in target_descs], dtype=bool)
+        has_desc = source_has_desc[:, None] & target_has_desc[None, :]
+        shape = has_desc.shape
+        source_idx = np.flatnonzero(source_has_desc)
+        target_idx = np.flatnonzero(target_has_desc)
+        with_desc = np.ix_(source_idx, target_idx)
+
+        def desc_matrix(scorer):
+            # Only score the rows and columns that have a description
+            matrix = np.zeros(shape, dtype=np.float64)
+            if len(source_idx) and len(target_idx):
+                matrix[with_desc] = scorer(
+                    [source_descs[i] for i in source_idx],
+                    [target_descs[j] for j in target_idx],
+                )
+            return matrix
+
+        scores = {"has_desc": has_desc}
+        name_lev = desc_lev = np.zeros(shape, dtype=np.float64)
+        if config.use_levenshtein:
+            lev_matrix = self.fuzzy_matcher.levenshtein_similarity_matrix
+            name_lev = lev_matrix(source_names, target_names)
+            desc_lev = desc_matrix(lev_matrix)
+            scores["name_lev"] = name_lev
+            scores["desc_lev"] = desc_lev
+
+        name_jw = desc_jw = np.zeros(shape, dtype=np.float64)
+        if config.use_jaro_winkler:
+            jw_bound_matrix = self.fuzzy_matcher.jaro_winkler_bound_matrix
+            name_jw = jw_bound_matrix(source_names, target_names)
+            desc_jw = desc_matrix(jw_bound_matrix)
+
+        # Weight and combine in place through one scratch buffer, so wide
+        # matrices do not allocate a temporary per arithmetic step
+        scratch = np.empty(shape, dtype=np.float64)
+
+        def weighted(lev, jw):
+            bound = np.multiply(lev, config.levenshtein_weight)
+            np.multiply(jw, config.jaro_winkler_weight, out=scratch)
+            bound += scratch
+            return bound
+
+        name_bound = weighted(name_lev, name_jw)
+        desc_bound = weighted(desc_lev, desc_jw)
+        scores["name_bound"] = name_bound
+
+        # Combined score: 70% name, 30% description where both have one
+        combined_bound = name_bound.copy()
+        np.multiply(name_bound, 0.7, out=scratch)
+        desc_bound *= 0.3
+        scratch += desc_bound
+        np.copyto(combined_bound, scratch, where=has_desc)
+        scores["combined_bound"] = combined_bound
+
+        return scores
+
+
+def _first_descriptions(fields: pd.DataFrame) -> Dict[str, Any]:
+    """Map each field name to the description of its first row."""
+    descriptions = {}
+    for name, desc in zip(
+        _column_values(fields, "field_name"),
+        _column_values(fields, "field_description", ""),
+        strict=True,
+    ):
+        descriptions.setdefault(name, desc)
+    return descriptions
+
+
+# Match types that count as exact mappings in create_advanced_column_mapping
+_EXACT_MATCH_TYPES = frozenset({"exact", "central_manual"})
 
 
 def create_advanced_column_mapping(
@@ -408,58 +659,54 @@ def create_advanced_column_mapping(
         central_memory, object_name or "", variant or ""
     )
 
-    # Apply skip rules first - remove skipped source fields
-    filtered_source_fields = source_fields.copy()
-    if skip_rules:
-        skip_dict = {rule.source_field: rule for rule in skip_rules if rule.skip}
+    # Skip rules win over manual mappings for the same source field
+    skip_dict = {rule.source_field: rule for rule in skip_rules if rule.skip}
+    mapping_dict = {
+        mapping.source_field: mapping
+        for mapping in manual_mappings
+        if mapping.source_field not in skip_dict
+    }
 
-        for source_field in skip_dict:
-            # Find matching rows in source_fields and mark for removal
-            mask = filtered_source_fields["field_name"] == source_field
-            if mask.any():
+    remaining_source_fields = source_fields
+    if skip_dict or mapping_dict:
+        source_descriptions = _first_descriptions(source_fields)
+
+        # Apply skip rules first
+        for source_field, rule in skip_dict.items():
+            if source_field in source_descriptions:
                 # Create skip match result for logging
-                row = filtered_source_fields[mask].iloc[0]
-                rule = skip_dict[source_field]
                 skip_result = FieldMatchResult(
                     source_field=source_field,
                     target_field=None,  # Skipped fields have no target
                     confidence_score=1.0,
                     match_type="central_skip",
                     reason=f"Central memory skip rule: {rule.comment}",
-                    source_description=row.get("field_description", ""),
+                    source_description=source_descriptions[source_field],
                     target_description=None,
                     algorithm="central_memory",
                 )
                 central_skip_matches.append(skip_result)
 
-                # Remove from source fields for further processing
-                filtered_source_fields = filtered_source_fields[~mask]
-
-    # Apply manual mappings next
-    remaining_source_fields = filtered_source_fields.copy()
-    if manual_mappings:
-        mapping_dict = {mapping.source_field: mapping for mapping in manual_mappings}
-
+        # Apply manual mappings next
         for source_field, mapping in mapping_dict.items():
-            # Find matching rows in remaining source fields
-            mask = remaining_source_fields["field_name"] == source_field
-            if mask.any():
+            if source_field in source_descriptions:
                 # Create manual mapping result for logging
-                row = remaining_source_fields[mask].iloc[0]
                 manual_result = FieldMatchResult(
                     source_field=source_field,
                     target_field=mapping.target,
                     confidence_score=1.0,
                     match_type="central_manual",
                     reason=f"Central memory manual mapping: {mapping.comment}",
-                    source_description=row.get("field_description", ""),
+                    source_description=source_descriptions[source_field],
                     target_description=mapping.target_description,
                     algorithm="central_memory",
                 )
                 central_manual_matches.append(manual_result)
 
-                # Remove from source fields for further processing
-                remaining_source_fields = remaining_source_fields[~mask]
+        # Remove skipped and manually mapped rows in one isin() mask
+        ruled_mask = source_fields["field_name"].isin([*skip_dict, *mapping_dict])
+        if ruled_mask.any():
+            remaining_source_fields = source_fields[~ruled_mask]
 
     # Run advanced matching on remaining fields
     matches, audit_matches = matcher.match_fields(
@@ -469,7 +716,8 @@ def create_advanced_column_mapping(
     # Combine all matches for final result
     all_matches = central_manual_matches + matches
 
-    # Create mapping lines for YAML generation
+    # Create mapping lines for YAML generation and bucket the matches in the
+    # same single pass
     mapping_lines = []
     exact_matches = []
     fuzzy_matches = []
@@ -477,7 +725,7 @@ def create_advanced_column_mapping(
 
     for match in all_matches:
         if match.target_field:
-            if match.match_type in ["exact", "central_manual"]:
+            if match.match_type in _EXACT_MATCH_TYPES:
                 exact_matches.append(match)
             else:
                 fuzzy_matches.append(match)
@@ -518,9 +766,25 @@ def load_central_mapping_memory(base_path: Path) -> Optional[CentralMappingMemor
     if not central_memory_path.exists():
         return None
 
+    stat = central_memory_path.stat()
+    return _load_central_mapping_memory_cached(
+        str(central_memory_path), stat.st_mtime_ns, stat.st_size
+    )
+
+
+@lru_cache(maxsize=8)
+def _load_central_mapping_memory_cached(
+    path_str: str, mtime_ns: int, size: int
+) -> Optional[CentralMappingMemory]:
+    """Parse central mapping memory; keyed on (path, mtime, size).
+
+    Repeated loads in one process share the parsed memory until the YAML's
+    mtime or size changes.
+    """
+    central_memory_path = Path(path_str)
     try:
-        with open(central_memory_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        with open(central_memory_path, "rb") as f:
+            data = yaml.load(f, Loader=YamlLoader)
 
         if not data:
             return None
@@ -564,7 +828,7 @@ def load_central_mapping_memory(base_path: Path) -> Optional[CentralMappingMemor
         # Parse synonyms
         synonyms = data.get("synonyms", {})
 
-        return CentralMappingMemory(
+        central_memory = CentralMappingMemory(
             global_skip_fields=global_skip_fields,
             global_manual_mappings=global_manual_mappings,
             table_specific=table_specific,
@@ -575,20 +839,38 @@ def load_central_mapping_memory(base_path: Path) -> Optional[CentralMappingMemor
         logger.warning(f"Could not load central mapping memory: {e}")
         return None
 
+    return central_memory
+
 
 def get_effective_rules_for_table(
     central_memory: CentralMappingMemory, object_name: str, variant: str
 ) -> Tuple[List[SkipRule], List[ManualMapping]]:
-    """Get effective skip rules and manual mappings for a specific table."""
+    """Get effective skip rules and manual mappings for a specific table.
+
+    The rule objects are built once per table and memoized on the memory;
+    callers get fresh lists but must not mutate the rules themselves.
+    """
     if not central_memory:
         return [], []
 
+    table_key = f"{object_name}_{variant}"
+    cached = central_memory._effective_rules.get(table_key)
+    if cached is None:
+        cached = _build_effective_rules(central_memory, table_key)
+        central_memory._effective_rules[table_key] = cached
+    skip_rules, manual_mappings = cached
+    return list(skip_rules), list(manual_mappings)
+
+
+def _build_effective_rules(
+    central_memory: CentralMappingMemory, table_key: str
+) -> Tuple[List[SkipRule], List[ManualMapping]]:
+    """Combine global rules with the table-specific rules for table_key."""
     # Start with global rules
     effective_skip_rules = central_memory.global_skip_fields.copy()
     effective_manual_mappings = central_memory.global_manual_mappings.copy()
 
     # Apply table-specific overrides
-    table_key = f"{object_name}_{variant}"
     table_rules = central_memory.table_specific.get(table_key, {})
 
     # Add table-specific skip rules
@@ -619,19 +901,48 @@ def get_effective_rules_for_table(
     return effective_skip_rules, effective_manual_mappings
 
 
+@lru_cache(maxsize=2)
+def _read_workbook_as_text_cached(
+    path_str: str, mtime_ns: int, size: int
+) -> Dict[str, pd.DataFrame]:
+    """Parse every worksheet; keyed on (path, mtime, size) so edits invalidate it.
+
+    The workbook is opened once and closed before returning, so only the
+    parsed frames are cached and the file is never held open (or locked).
+    """
+    import pandas as pd
+
+    with pd.ExcelFile(path_str, engine="openpyxl") as excel_file:
+        return {
+            sheet_name: excel_file.parse(sheet_name, header=None, dtype=str)
+            for sheet_name in excel_file.sheet_names
+        }
+
+
+def _read_workbook_as_text(file_path: Path) -> Dict[str, pd.DataFrame]:
+    """Read all worksheets (sheet name -> frame, in workbook order) as text.
+
+    Worksheet detection, header detection and column analysis all need the
+    same frames, so the workbook is parsed once. The returned frames are
+    shared between callers and must be treated as read-only.
+    """
+    st = Path(file_path).stat()
+    return _read_workbook_as_text_cached(str(file_path), st.st_mtime_ns, st.st_size)
+
+
+def _read_sheet_as_text(file_path: Path, sheet_name: str) -> pd.DataFrame:
+    """Read a worksheet with no header row and as text, through the parse cache."""
+    frames = _read_workbook_as_text(file_path)
+    if sheet_name not in frames:
+        raise ValueError(f"Worksheet named '{sheet_name}' not found")
+    return frames[sheet_name]
+
+
 def find_first_non_empty_worksheet(file_path: Path) -> str:
     """Find the first non-empty worksheet in an Excel file."""
     try:
-        excel_file = pd.ExcelFile(file_path)
-        for sheet_name in excel_file.sheet_names:
-            # Read with no header row and as text to properly detect headers
-            df = pd.read_excel(
-                file_path,
-                sheet_name=sheet_name,
-                header=None,
-                dtype=str,
-                engine="openpyxl",
-            )
+        # Read with no header row and as text to properly detect headers
+        for sheet_name, df in _read_workbook_as_text(file_path).items():
             if not df.empty:
                 # Check if any row has non-empty content
                 def is_nonempty_row(r):
@@ -650,9 +961,7 @@ def find_header_row(file_path: Path, sheet_name: str) -> Tuple[int, List[str]]:
     """Find the first row with ≥1 non-empty cell and return headers."""
     try:
         # Read Excel with no header row and as text
-        df = pd.read_excel(
-            file_path, sheet_name=sheet_name, header=None, dtype=str, engine="openpyxl"
-        )
+        df = _read_sheet_as_text(file_path, sheet_name)
 
         def is_nonempty_row(r):
             return any((str(x).strip() != "") for x in r.tolist() if x is not None)
@@ -672,11 +981,12 @@ def analyze_column_data(
     file_path: Path, sheet_name: str, header_row: int, headers: List[str]
 ) -> List[Dict]:
     """Analyze column data to infer types, nullable status, and examples."""
+    import pandas as pd
+    from pandas.api.types import infer_dtype
+
     try:
         # Read Excel with no header row and as text
-        df = pd.read_excel(
-            file_path, sheet_name=sheet_name, header=None, dtype=str, engine="openpyxl"
-        )
+        df = _read_sheet_as_text(file_path, sheet_name)
 
         # Data rows may be zero
         data = df.iloc[header_row + 1 :].reset_index(drop=True)
@@ -1010,6 +1320,7 @@ def parse_csv_field_definitions(csv_path: Path) -> List[Dict]:
 def run_index_source_command(args, config):
     """Run the index_source command - parse headers from XLSX and create index_source.yaml."""
     from .enhanced_logging import EnhancedLogger
+    from .reporting import write_html_report
 
     warnings = []
     root_path = Path(args.root) if hasattr(args, "root") else Path(".")
@@ -1131,13 +1442,16 @@ def run_index_source_command(args, config):
                 f"Output file exists and --force not specified: {output_file}"
             )
         else:
+            # One timestamp for the schema below and the written metadata
+            generated_at = datetime.now().isoformat()
+
             # Create YAML structure with correct schema
             {
                 "metadata": {
                     "object": args.object,
                     "variant": args.variant,
                     "source_file": str(input_file.relative_to(root_path)),
-                    "generated_at": datetime.now().isoformat(),
+                    "generated_at": generated_at,
                     "sheet": sheet_name,
                     "source_fields_count": len(source_fields),
                 },
@@ -1151,7 +1465,7 @@ def run_index_source_command(args, config):
                 f.write(f"  object: {args.object}\n")
                 f.write(f"  variant: {args.variant}\n")
                 f.write(f"  source_file: {input_file.relative_to(root_path)}\n")
-                f.write(f"  generated_at: '{datetime.now().isoformat()}'\n")
+                f.write(f"  generated_at: '{generated_at}'\n")
 
                 # Only include sheet for XLSX files
                 if not is_csv_fallback and sheet_name:
@@ -1225,8 +1539,6 @@ def run_index_source_command(args, config):
             import json
             from datetime import datetime as dt
 
-            from .reporting import write_html_report
-
             timestamp = dt.now().strftime("%Y%m%d_%H%M")
 
             # Determine report directory for F01 (index_source) reports
@@ -1297,7 +1609,7 @@ def run_index_source_command(args, config):
             write_html_report(html_summary, html_path, title)
 
             # Human-readable logging with forward slashes
-            html_path_display = str(html_path.relative_to(root_path)).replace("\\", "/")
+            html_path_display = html_path.relative_to(root_path).as_posix()
             if not (args.json or not sys.stdout.isatty()):
                 print(f"report: {html_path_display}")
 
@@ -1353,6 +1665,54 @@ def _clean_xml_file(xml_path: Path) -> Path:
     return xml_path
 
 
+_SPREADSHEETML_NS = {"ss": "urn:schemas-microsoft-com:office:spreadsheet"}
+_SS_WORKSHEET = f'{{{_SPREADSHEETML_NS["ss"]}}}Worksheet'
+_SS_ROW = f'{{{_SPREADSHEETML_NS["ss"]}}}Row'
+_SS_NAME = f'{{{_SPREADSHEETML_NS["ss"]}}}Name'
+
+
+def _iter_field_list_rows_streaming(xml_path: Path):
+    """
+    Yield the Row elements of the first "Field List" worksheet while parsing.
+
+    Rows are cleared once consumed, so memory stays at one row instead of the
+    whole workbook tree. The whole document is still read, so malformed XML
+    anywhere raises ParseError just like ET.parse.
+    """
+    import xml.etree.ElementTree as ET
+
+    found = False
+    in_field_list = False
+    for event, elem in ET.iterparse(xml_path, events=("start", "end")):
+        if elem.tag == _SS_WORKSHEET:
+            if event == "start":
+                in_field_list = not found and elem.get(_SS_NAME, "") == "Field List"
+                found = found or in_field_list
+            else:
+                in_field_list = False
+                elem.clear()
+        elif event == "end" and elem.tag == _SS_ROW:
+            if in_field_list:
+                yield elem
+            elem.clear()
+
+    if not found:
+        raise ValueError("Worksheet 'Field List' not found")
+
+
+def _iter_field_list_rows(root):
+    """Yield the Row elements of the first "Field List" worksheet in a tree."""
+    ns = _SPREADSHEETML_NS
+
+    # Find the "Field List" worksheet
+    for ws in root.findall(".//ss:Worksheet", ns):
+        if ws.get(_SS_NAME, "") == "Field List":
+            yield from ws.findall(".//ss:Row", ns)
+            return
+
+    raise ValueError("Worksheet 'Field List' not found")
+
+
 def _parse_spreadsheetml_target_fields(
     xml_path: Path, variant: str
 ) -> List[Dict[str, Any]]:
@@ -1372,23 +1732,32 @@ def _parse_spreadsheetml_target_fields(
 
     has_comments = "<!--" in content
     has_control_chars = any(ord(c) < 32 and c not in "\t\n\r" for c in content)
+    del content
 
-    # Try parsing with standard library first
-    try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-
-        # If parsing succeeded but we detected comments/control chars, proactively clean
-        if has_comments or has_control_chars:
+    # Clean files are streamed row by row; files with comments or control
+    # characters are cleaned and re-parsed as a tree. If parsing fails, fall
+    # back to lxml's recovery parser.
+    root = None
+    if not (has_comments or has_control_chars):
+        try:
+            return _spreadsheetml_rows_to_target_fields(
+                _iter_field_list_rows_streaming(xml_path), variant
+            )
+        except ET.ParseError:
+            pass
+    else:
+        try:
+            ET.parse(xml_path)
             print(
                 "XML file contains comments or illegal characters. Old file is backed-up and cleaned."
             )
             _clean_xml_file(xml_path)
             # Re-parse the cleaned file
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
+            root = ET.parse(xml_path).getroot()
+        except ET.ParseError:
+            pass
 
-    except ET.ParseError:
+    if root is None:
         # If parsing fails, try with lxml's recovery parser
         try:
             parser = etree.XMLParser(recover=True)
@@ -1398,41 +1767,35 @@ def _parse_spreadsheetml_target_fields(
             # Convert lxml tree to ElementTree for compatibility
             xml_string = etree.tostring(lxml_tree, encoding="unicode")
             root = ET.fromstring(xml_string)
-            tree = None  # We don't need the tree object, just the root
         except Exception:
             # Last resort: clean the file and try again
             print(
                 "XML file contains comments or illegal characters. Old file is backed-up and cleaned."
             )
             cleaned_path = _clean_xml_file(xml_path)
-            tree = ET.parse(cleaned_path)
-            root = tree.getroot()
+            root = ET.parse(cleaned_path).getroot()
 
-    # Define namespace
-    ns = {"ss": "urn:schemas-microsoft-com:office:spreadsheet"}
+    return _spreadsheetml_rows_to_target_fields(_iter_field_list_rows(root), variant)
 
-    # Find the "Field List" worksheet
-    worksheet = None
-    for ws in root.findall(".//ss:Worksheet", ns):
-        name = ws.get(f'{{{ns["ss"]}}}Name', "")
-        if name == "Field List":
-            worksheet = ws
-            break
-
-    if worksheet is None:
-        raise ValueError("Worksheet 'Field List' not found")
 
-    # Get worksheet name for fallback
-    worksheet_name = worksheet.get(f'{{{ns["ss"]}}}Name', "")
+def _spreadsheetml_rows_to_target_fields(rows, variant: str) -> List[Dict[str, Any]]:
+    """
+    Turn the Row elements of the "Field List" worksheet into target fields.
 
-    # Get all rows
-    rows = worksheet.findall(".//ss:Row", ns)
+    Rows are handled one at a time (the header row is the first row with
+    "Sheet Name" in any column), so a streaming row source is never held in
+    memory as a whole.
+    """
+    ns = _SPREADSHEETML_NS
+    worksheet_name = "Field List"
 
     # Parse rows with ss:Index and ss:MergeDown support
-    parsed_rows = []
     carry = {}  # For vertical propagation (ss:MergeDown)
+    header_found = False
+    target_fields = []
+    field_count = 1
 
-    for _row_idx, row in enumerate(rows):
+    for row in rows:
         col = 1  # 1-based column pointer
         row_data = [None] * 15  # Pre-allocate for up to 15 columns
 
@@ -1473,27 +1836,11 @@ def _parse_spreadsheetml_target_fields(
 
             col += 1
 
-        parsed_rows.append(row_data)
-
-    # Find header row - look for "Sheet Name" in any column
-    header_row_idx = None
-    for i, row_data in enumerate(parsed_rows):
-        for cell in row_data:
-            if cell and "Sheet Name" in str(cell):
-                header_row_idx = i
-                break
-        if header_row_idx is not None:
-            break
-
-    if header_row_idx is None:
-        raise ValueError("Header row with 'Sheet Name' not found")
-
-    # Process data rows
-    target_fields = []
-    f"S_{variant.upper()}"
-    field_count = 1
+        # Find header row - look for "Sheet Name" in any column
+        if not header_found:
+            header_found = any(cell and "Sheet Name" in str(cell) for cell in row_data)
+            continue
 
-    for row_data in parsed_rows[header_row_idx + 1 :]:
         # Skip empty rows
         if not any(cell for cell in row_data if cell and str(cell).strip()):
             continue
@@ -1600,6 +1947,9 @@ def _parse_spreadsheetml_target_fields(
         target_fields.append(row_dict)
         field_count += 1
 
+    if not header_found:
+        raise ValueError("Header row with 'Sheet Name' not found")
+
     return target_fields
 
 
@@ -1609,6 +1959,7 @@ def run_index_target_command(args, config):
     from pathlib import Path
 
     from .enhanced_logging import EnhancedLogger
+    from .reporting import write_html_report
 
     root_path = Path(args.root).resolve()
 
@@ -1620,6 +1971,7 @@ def run_index_target_command(args, config):
 
     input_file = xml_file
     xml_parse_error = None
+    xml_target_fields = None  # fields parsed while validating the XML
 
     # Check if --prefer-xlsx flag is set
     prefer_xlsx = getattr(args, "prefer_xlsx", False)
@@ -1638,8 +1990,11 @@ def run_index_target_command(args, config):
         # Check if XML file exists and can be parsed
         if xml_file.exists():
             try:
-                # Try to parse XML to validate it's readable
-                _parse_spreadsheetml_target_fields(xml_file, args.variant)
+                # Try to parse XML to validate it's readable (the result is
+                # reused below instead of parsing the file a second time)
+                xml_target_fields = _parse_spreadsheetml_target_fields(
+                    xml_file, args.variant
+                )
                 # If successful, use XML file
                 input_file = xml_file
             except Exception as e:
@@ -1696,7 +2051,9 @@ def run_index_target_command(args, config):
         sys.exit(5)
 
     try:
-        if input_file.suffix == ".xml":
+        if xml_target_fields is not None and input_file == xml_file:
+            target_fields = xml_target_fields
+        elif input_file.suffix == ".xml":
             target_fields = _parse_spreadsheetml_target_fields(input_file, args.variant)
         elif input_file.suffix == ".xlsx":
             # Import xlsx parser
@@ -1714,13 +2071,16 @@ def run_index_target_command(args, config):
             logger.log_error(error_data)
             sys.exit(3)
 
+        # One timestamp for index_target.yaml, validation.yaml and transform.yaml
+        generated_at = datetime.now().isoformat()
+
         # Create output YAML structure with exact metadata schema
         {
             "metadata": {
                 "object": args.object,
                 "variant": args.variant,
                 "target_file": f"data/02_target/{args.object}_{args.variant}.xml",
-                "generated_at": datetime.now().isoformat(),
+                "generated_at": generated_at,
                 "structure": f"S_{args.variant.upper()}",
                 "target_fields_count": len(target_fields),
             },
@@ -1734,7 +2094,7 @@ def run_index_target_command(args, config):
             f.write(f"  object: {args.object}\n")
             f.write(f"  variant: {args.variant}\n")
             f.write(f"  target_file: {input_file.relative_to(root_path)}\n")
-            f.write(f"  generated_at: '{datetime.now().isoformat()}'\n")
+            f.write(f"  generated_at: '{generated_at}'\n")
             f.write(f"  structure: S_{args.variant.upper()}\n")
             f.write(f"  target_fields_count: {len(target_fields)}\n")
 
@@ -1846,7 +2206,7 @@ def run_index_target_command(args, config):
                 f.write(
                     f"  target_file: data/02_target/{args.object}_{args.variant}.xml\n"
                 )
-                f.write(f"  generated_at: '{datetime.now().isoformat()}'\n")
+                f.write(f"  generated_at: '{generated_at}'\n")
                 f.write(f"  structure: S_{args.variant.upper()}\n")
                 f.write("\n\n\n")  # Add 3 blank lines after metadata
 
@@ -1913,7 +2273,7 @@ def run_index_target_command(args, config):
                 f.write(
                     f"  target_file: data/02_target/{args.object}_{args.variant}.xml\n"
                 )
-                f.write(f"  generated_at: '{datetime.now().isoformat()}'\n")
+                f.write(f"  generated_at: '{generated_at}'\n")
                 f.write(f"  structure: S_{args.variant.upper()}\n")
                 f.write(
                     f"  description: 'Transformation rules for {args.object}/{args.variant}'\n"
@@ -1989,8 +2349,6 @@ def run_index_target_command(args, config):
             import json
             from datetime import datetime as dt
 
-            from .reporting import write_html_report
-
             timestamp = dt.now().strftime("%Y%m%d_%H%M")
 
             # Determine report directory for F02 (index_target) reports
@@ -2067,7 +2425,7 @@ def run_index_target_command(args, config):
             write_html_report(html_summary, html_path, title)
 
             # Human-readable logging with forward slashes
-            html_path_display = str(html_path.relative_to(root_path)).replace("\\", "/")
+            html_path_display = html_path.relative_to(root_path).as_posix()
             if not (args.json or not sys.stdout.isatty()):
                 print(f"report: {html_path_display}")
 
@@ -2088,33 +2446,50 @@ def update_object_list(object_name: str, variant: str, root_path: Path = None):
 
     # Load existing data if file exists
     object_list_data = {"entries": []}
+    existing_text = ""
     if object_list_file.exists():
         try:
-            with open(object_list_file, encoding="utf-8") as f:
-                existing_data = yaml.safe_load(f)
-                if existing_data and "entries" in existing_data:
-                    object_list_data = existing_data
+            text = object_list_file.read_text(encoding="utf-8")
+            existing_data = yaml.load(text, Loader=YamlLoader)
+            if existing_data and "entries" in existing_data:
+                object_list_data = existing_data
+                # Only a file that loaded may be appended to below
+                existing_text = text
         except Exception:
             pass  # Use default structure if file is corrupted
 
     # Check if this object/variant combination already exists
-    existing_entries = []
-    for entry in object_list_data["entries"]:
-        if entry.get("object") == object_name and entry.get("variant") == variant:
-            existing_entries.append(entry)
-
-    if not existing_entries:
-        new_entry = {
-            "object": object_name,
-            "variant": variant,
-            "added_at": datetime.now().isoformat(),
-        }
-        object_list_data["entries"].append(new_entry)
+    existing_keys = {
+        (entry.get("object"), entry.get("variant"))
+        for entry in object_list_data["entries"]
+    }
+    if (object_name, variant) in existing_keys:
+        return
 
-        # Write updated object list
-        object_list_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(object_list_file, "w", encoding="utf-8") as f:
-            yaml.dump(object_list_data, f, default_flow_style=False, allow_unicode=True)
+    new_entry = {
+        "object": object_name,
+        "variant": variant,
+        "added_at": datetime.now().isoformat(),
+    }
+    object_list_file.parent.mkdir(parents=True, exist_ok=True)
+
+    # The layout written below is a block list under a lone "entries" key, so
+    # a new item can be appended instead of re-dumping every existing entry.
+    appendable = (
+        list(object_list_data) == ["entries"]
+        and existing_text.startswith("entries:\n- ")
+        and existing_text.endswith("\n")
+    )
+    if appendable:
+        with open(object_list_file, "a", encoding="utf-8") as f:
+            f.write(dump_yaml([new_entry]))
+        return
+
+    object_list_data["entries"].append(new_entry)
+
+    # Write updated object list
+    with open(object_list_file, "w", encoding="utf-8") as f:
+        f.write(dump_yaml(object_list_data))
 
 
 def apply_central_memory_to_unmapped_fields(
@@ -2240,17 +2615,6 @@ def process_f03_mapping(source_fields, target_fields, synonyms, object_name, var
             return len(candidate) < len(current_best)
         return False
 
-    def norm(s):
-        if not s:
-            return ""
-        # lower → non-alphanumeric to space → collapse spaces → strip
-        import re
-
-        lowered = s.lower()
-        spaces = re.sub(r"[^a-zA-Z0-9]", " ", lowered)
-        collapsed = re.sub(r"\s+", " ", spaces)
-        return collapsed.strip()
-
     # Extract verbatim and normalized headers, creating a lookup map for field names
     # Prioritize new names (source_field) but support old names (source_field_name) for backward compatibility
     verbatim_headers = [
@@ -2259,7 +2623,12 @@ def process_f03_mapping(source_fields, target_fields, synonyms, object_name, var
         )
         for field in source_fields
     ]
-    [norm(header) for header in verbatim_headers]
+    normalized_headers = [_normalize_header(header) for header in verbatim_headers]
+
+    # Normalized header -> first header with that form, for exact lookups
+    first_header_by_norm = {}
+    for header, norm_header in zip(verbatim_headers, normalized_headers, strict=True):
+        first_header_by_norm.setdefault(norm_header, header)
 
     # Create lookup map from header to source field for preserving field_name information
     header_to_field = {
@@ -2272,6 +2641,63 @@ def process_f03_mapping(source_fields, target_fields, synonyms, object_name, var
     # Create fuzzy matcher components
     normalizer = FieldNormalizer()
     fuzzy_matcher = FuzzyMatcher()
+    field_norm_headers = [
+        normalizer.normalize_field_name(header) for header in verbatim_headers
+    ]
+
+    def target_name_and_desc(target):
+        # Prioritize new names (target_field) but support old names (target_field_name, sap_field) for backward compatibility
+        t_name = target.get(
+            "target_field", target.get("target_field_name", target.get("sap_field", ""))
+        ).lower()
+        t_desc = (
+            target.get("target_field_description", target.get("field_description", ""))
+            or ""
+        ).lower()
+        return t_name, t_desc
+
+    # Every normalized target name/description scored against all headers in
+    # one cdist call per matrix, so rapidfuzz's worker threads (workers=-1)
+    # split the whole workload instead of one small row per target
+    norm_target_texts = list(
+        dict.fromkeys(
+            normalizer.normalize_field_name(text)
+            for target in target_fields
+            for text in target_name_and_desc(target)
+            if text
+        )
+    )
+    text_rows = {text: row for row, text in enumerate(norm_target_texts)}
+    lev_matrix = fuzzy_matcher.levenshtein_similarity_matrix(
+        norm_target_texts, field_norm_headers
+    )
+    jw_bound_matrix = fuzzy_matcher.jaro_winkler_bound_matrix(
+        norm_target_texts, field_norm_headers
+    )
+
+    def header_similarities(target_text):
+        """max(Levenshtein, Jaro-Winkler) of every header against target_text.
+
+        Levenshtein and a Jaro-Winkler upper bound come from the batch
+        matrices; the exact Jaro-Winkler only runs where it can raise the
+        score to the 0.80 floor. Scores below that floor are not exact (but
+        stay below it).
+        """
+        norm_target = normalizer.normalize_field_name(target_text)
+        row = text_rows[norm_target]
+        lev_row = lev_matrix[row].tolist()
+        jw_bound_row = jw_bound_matrix[row].tolist()
+        scores = []
+        for norm_header, lev_sim, jw_bound in zip(
+            field_norm_headers, lev_row, jw_bound_row, strict=True
+        ):
+            # The small margin absorbs float rounding in the bound
+            if lev_sim >= jw_bound + 1e-9 or jw_bound + 1e-9 < 0.80:
+                scores.append(lev_sim)
+            else:
+                jw_sim = fuzzy_matcher.jaro_winkler_similarity(norm_header, norm_target)
+                scores.append(max(lev_sim, jw_sim))
+        return scores
 
     # Initialize result structures
     mappings = []
@@ -2283,14 +2709,7 @@ def process_f03_mapping(source_fields, target_fields, synonyms, object_name, var
 
     # Process each target field (target-centric approach)
     for target in target_fields:
-        # Prioritize new names (target_field) but support old names (target_field_name, sap_field) for backward compatibility
-        t_name = target.get(
-            "target_field", target.get("target_field_name", target.get("sap_field", ""))
-        ).lower()
-        t_desc = (
-            target.get("target_field_description", target.get("field_description", ""))
-            or ""
-        ).lower()
+        t_name, t_desc = target_name_and_desc(target)
         t_table = target.get("target_table", target.get("sap_table", "")).lower()
         required = bool(
             target.get("target_is_mandatory", target.get("mandatory", False))
@@ -2301,21 +2720,23 @@ def process_f03_mapping(source_fields, target_fields, synonyms, object_name, var
         best_rationale = "none"
         candidates = []  # For tie-break detection
 
-        # 1. EXACT MATCH: norm(header) == t_name
-        for _i, header in enumerate(verbatim_headers):
-            if norm(header) == t_name:
-                best_match = header
-                best_confidence = 1.00
-                best_rationale = "Exact field name match"
-                break
+        # 1. EXACT MATCH: normalized header == t_name (first header wins)
+        if t_name in first_header_by_norm:
+            best_match = first_header_by_norm[t_name]
+            best_confidence = 1.00
+            best_rationale = "Exact field name match"
 
         # 2. SYNONYM MATCH: if no exact match and synonyms available
         if not best_match and synonyms:
             t_name_upper = t_name.upper()
             if t_name_upper in synonyms:
-                synonym_variants = synonyms[t_name_upper]
-                for _i, header in enumerate(verbatim_headers):
-                    if norm(header) in [norm(variant) for variant in synonym_variants]:
+                synonym_variants = {
+                    _normalize_header(variant) for variant in synonyms[t_name_upper]
+                }
+                for header, norm_header in zip(
+                    verbatim_headers, normalized_headers, strict=True
+                ):
+                    if norm_header in synonym_variants:
                         best_match = header
                         best_confidence = 0.95
                         best_rationale = "Matched via synonym definition"
@@ -2323,33 +2744,14 @@ def process_f03_mapping(source_fields, target_fields, synonyms, object_name, var
 
         # 3. FUZZY MATCH: against t_name and t_desc
         if not best_match:
-            for _i, header in enumerate(verbatim_headers):
-                norm_header = normalizer.normalize_field_name(header)
-
-                # Try against target field name
-                name_score = 0.0
-                if t_name:
-                    norm_target_name = normalizer.normalize_field_name(t_name)
-                    lev_sim = fuzzy_matcher.levenshtein_similarity(
-                        norm_header, norm_target_name
-                    )
-                    jw_sim = fuzzy_matcher.jaro_winkler_similarity(
-                        norm_header, norm_target_name
-                    )
-                    name_score = max(lev_sim, jw_sim)
-
-                # Try against target description
-                desc_score = 0.0
-                if t_desc:
-                    norm_target_desc = normalizer.normalize_field_name(t_desc)
-                    lev_sim = fuzzy_matcher.levenshtein_similarity(
-                        norm_header, norm_target_desc
-                    )
-                    jw_sim = fuzzy_matcher.jaro_winkler_similarity(
-                        norm_header, norm_target_desc
-                    )
-                    desc_score = max(lev_sim, jw_sim)
+            # Scores against the target field name and description
+            no_scores = [0.0] * len(verbatim_headers)
+            name_scores = header_similarities(t_name) if t_name else no_scores
+            desc_scores = header_similarities(t_desc) if t_desc else no_scores
 
+            for header, name_score, desc_score in zip(
+                verbatim_headers, name_scores, desc_scores, strict=True
+            ):
                 # Take the maximum score from name and description matching
                 score = max(name_score, desc_score)
 
@@ -2557,6 +2959,7 @@ def run_map_command(args, config):
     import time
 
     from .enhanced_logging import EnhancedLogger
+    from .reporting import write_html_report
 
     start_time = time.time()
 
@@ -2592,8 +2995,30 @@ def run_map_command(args, config):
         logger.log_error(error_data)
         sys.exit(3)
 
-    # Check if output exists and enforce --force policy
+    # Check if output exists and enforce --force policy; a mapping.yaml newer
+    # than both indexes and the central mapping memory is up to date, so there
+    # is nothing to redo (--force regenerates it anyway)
     if mapping_file.exists() and not args.force:
+        input_files = [source_index_file, target_index_file]
+        if central_mapping_file.exists():
+            input_files.append(central_mapping_file)
+        newest_input_ns = max(path.stat().st_mtime_ns for path in input_files)
+        if mapping_file.stat().st_mtime_ns > newest_input_ns:
+            logger.log_event(
+                {
+                    "step": "map",
+                    "object": args.object,
+                    "variant": args.variant,
+                    "source_index": _posix(source_index_file),
+                    "target_index": _posix(target_index_file),
+                    "output_file": _posix(mapping_file),
+                    "status": "up_to_date",
+                    "duration_ms": int((time.time() - start_time) * 1000),
+                    "warnings": [],
+                }
+            )
+            return
+
         error_data = {
             "error": "would_overwrite",
             "path": str(mapping_file),
@@ -2602,9 +3027,9 @@ def run_map_command(args, config):
         sys.exit(5)
 
     try:
-        # Load and validate source fields
-        with open(source_index_file, encoding="utf-8") as f:
-            source_data = yaml.safe_load(f)
+        # Load and validate source fields (as bytes; the loader decodes UTF-8)
+        with open(source_index_file, "rb") as f:
+            source_data = yaml.load(f, Loader=YamlLoader)
         
         try:
             validate_index_source(source_data)
@@ -2614,8 +3039,8 @@ def run_map_command(args, config):
             raise
 
         # Load and validate target fields
-        with open(target_index_file, encoding="utf-8") as f:
-            target_data = yaml.safe_load(f)
+        with open(target_index_file, "rb") as f:
+            target_data = yaml.load(f, Loader=YamlLoader)
         
         try:
             validate_index_target(target_data)
@@ -2642,8 +3067,8 @@ def run_map_command(args, config):
             synonyms = central_memory.synonyms
         elif central_mapping_file.exists():
             try:
-                with open(central_mapping_file, encoding="utf-8") as f:
-                    central_data = yaml.safe_load(f)
+                with open(central_mapping_file, "rb") as f:
+                    central_data = yaml.load(f, Loader=YamlLoader)
                     synonyms = central_data.get("synonyms", {})
             except Exception:
                 pass  # Continue without synonyms if file is corrupted
@@ -2686,77 +3111,30 @@ def run_map_command(args, config):
 
         # Write mapping.yaml with exact format and proper blank lines
         mapping_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(mapping_file, "w", encoding="utf-8") as f:
-            # Write metadata section
-            yaml.safe_dump(
-                {"metadata": output_data["metadata"]},
-                f,
-                sort_keys=False,
-                allow_unicode=True,
-                default_flow_style=False,
-            )
-
-            # Add 3 blank lines between sections
-            f.write("\n\n\n")
 
-            # Write mappings section with special formatting (1 blank line between records)
-            f.write("mappings:\n")
-            for i, mapping in enumerate(output_data["mappings"]):
-                # Write each mapping item with proper indentation
-                mapping_yaml = yaml.safe_dump(
-                    [mapping], default_flow_style=False, allow_unicode=True
-                )
-                # Process the YAML lines correctly to maintain proper structure
-                lines = mapping_yaml.strip().split("\n")
-                for j, line in enumerate(lines):
-                    if j == 0:
-                        # First line: ensure it starts with "- " for list item
-                        if line.startswith("- "):
-                            f.write(line + "\n")
-                        else:
-                            f.write("- " + line + "\n")
-                    else:
-                        # Subsequent lines: maintain proper 2-space indentation for list item content
-                        if line.startswith("  "):
-                            f.write(line + "\n")
-                        else:
-                            f.write("  " + line + "\n")
-
-                # Add blank line between mapping records (except after the last one)
-                if i < len(output_data["mappings"]) - 1:
-                    f.write("\n")
-
-            # Add 3 blank lines before next section
-            f.write("\n\n\n")
-
-            # Write to_audit section
-            yaml.safe_dump(
-                {"to_audit": output_data["to_audit"]},
-                f,
-                sort_keys=False,
-                allow_unicode=True,
-                default_flow_style=False,
+        # Mappings section with special formatting (1 blank line between
+        # records): dump all records at once, then split them at the
+        # top-level "- " items
+        mappings_yaml = "mappings:\n"
+        if output_data["mappings"]:
+            mappings_yaml += dump_yaml(output_data["mappings"]).replace(
+                "\n- ", "\n\n- "
             )
-            f.write("\n\n\n")
-
-            # Write unmapped_source_fields section
-            yaml.safe_dump(
-                {"unmapped_source_fields": output_data["unmapped_source_fields"]},
-                f,
-                sort_keys=False,
-                allow_unicode=True,
-                default_flow_style=False,
-            )
-            f.write("\n\n\n")
 
-            # Write unmapped_target_fields section
-            yaml.safe_dump(
-                {"unmapped_target_fields": output_data["unmapped_target_fields"]},
-                f,
-                sort_keys=False,
-                allow_unicode=True,
-                default_flow_style=False,
+        # Sections are separated by 3 blank lines and written in one go
+        sections = [
+            dump_yaml({"metadata": output_data["metadata"]}, sort_keys=False),
+            mappings_yaml,
+        ] + [
+            dump_yaml({key: output_data[key]}, sort_keys=False)
+            for key in (
+                "to_audit",
+                "unmapped_source_fields",
+                "unmapped_target_fields",
             )
+        ]
+        with open(mapping_file, "w", encoding="utf-8") as f:
+            f.write("\n\n\n".join(sections))
 
         duration_ms = int((time.time() - start_time) * 1000)
 
@@ -2765,9 +3143,9 @@ def run_map_command(args, config):
             "step": "map",
             "object": args.object,
             "variant": args.variant,
-            "source_index": str(source_index_file).replace("\\", "/"),
-            "target_index": str(target_index_file).replace("\\", "/"),
-            "output_file": str(mapping_file).replace("\\", "/"),
+            "source_index": _posix(source_index_file),
+            "target_index": _posix(target_index_file),
+            "output_file": _posix(mapping_file),
             "mapped": mapped_count,
             "unmapped": unmapped_count,
             "to_audit": to_audit_count,
@@ -2778,138 +3156,147 @@ def run_map_command(args, config):
 
         # Add ruleset_sources to metadata if central mapping file exists
         if central_mapping_file.exists():
-            output_data["metadata"]["ruleset_sources"] = str(
-                central_mapping_file
-            ).replace("\\", "/")
-            summary_data["ruleset_sources"] = str(central_mapping_file).replace(
-                "\\", "/"
-            )
+            ruleset_sources = _posix(central_mapping_file)
+            output_data["metadata"]["ruleset_sources"] = ruleset_sources
+            summary_data["ruleset_sources"] = ruleset_sources
 
-        # Prepare preview data for human output (first 12 mappings)
+        # Prepare preview data for human output (first 12 mappings) and, when
+        # the HTML report is enabled, its mapping rows in the same pass
+        html_enabled = not getattr(args, "no_html", False)
         preview_data = []
-        for mapping in mapping_result["mappings"][:12]:
-            preview_data.append(
-                {
-                    "target_field": mapping["target_field_name"],
-                    "source_header": mapping.get("source_header", "null") or "null",
-                    "source_field_name": mapping.get(
-                        "source_field_name", "field_name onbekend"
-                    ),  # Always show field_name
-                    "confidence": f"{mapping['map_confidence']:.2f}",
-                    "status": mapping["map_status"],
-                }
-            )
-
-        # Log event using Enhanced Logger (this will handle both stdout and file logging)
-        logger.log_event(summary_data, preview_data)
-
-        # Generate HTML report if enabled
-        if not getattr(args, "no_html", False):
-            import json
-            from datetime import datetime as dt
-
-            from .reporting import write_html_report
-
-            timestamp = dt.now().strftime("%Y%m%d_%H%M")
-
-            # Determine report directory for F03 (map) reports
-            if hasattr(args, "html_dir") and args.html_dir:
-                reports_dir = Path(args.html_dir)
-            else:
-                reports_dir = root_path / "data" / "05_map"
-
-            # Generate enriched summary for HTML report
-            html_summary = {
-                "step": "map",
-                "object": args.object,
-                "variant": args.variant,
-                "ts": dt.now().isoformat(),
-                "source_index": str(source_index_file.relative_to(Path(args.root))),
-                "target_index": str(target_index_file.relative_to(Path(args.root))),
-                "mapped": mapped_count,
-                "unmapped": unmapped_count,
-                "to_audit": to_audit_count,
-                "unused_sources": unused_sources_count,
-                "mappings": [
+        html_mappings = []
+        for i, mapping in enumerate(mapping_result["mappings"]):
+            if i >= 12 and not html_enabled:
+                break
+            target_field_name = mapping["target_field_name"]
+            if i < 12:
+                preview_data.append(
+                    {
+                        "target_field": target_field_name,
+                        "source_header": mapping.get("source_header", "null") or "null",
+                        "source_field_name": mapping.get(
+                            "source_field_name", "field_name onbekend"
+                        ),  # Always show field_name
+                        "confidence": f"{mapping['map_confidence']:.2f}",
+                        "status": mapping["map_status"],
+                    }
+                )
+            if html_enabled:
+                html_mappings.append(
                     {
                         "target_table": mapping.get("target_table", ""),
-                        "target_field": mapping["target_field_name"],
+                        "target_field": target_field_name,
                         "source_header": mapping.get("source_header", ""),
                         "required": mapping.get("required", False),
                         "confidence": mapping["map_confidence"],
                         "status": mapping["map_status"],
                         "rationale": mapping["map_rationale"],
                     }
-                    for mapping in mapping_result["mappings"]
-                ],
-                "to_audit_rows": [
-                    {
-                        "target_table": audit.get("target_table", ""),
-                        "target_field": audit["target_field_name"],
-                        "source_header": audit.get("source_header"),
-                        "confidence": audit.get("confidence", 0.0),
-                        "reason": audit.get("reason", ""),
-                    }
-                    for audit in mapping_result["to_audit"]
-                ],
-                "unmapped_source_fields": mapping_result["unmapped_source_fields"],
-                "unmapped_target_fields": [
-                    (
+                )
+
+        # Generate HTML report if enabled; the JSON/HTML files are written on a
+        # background thread while the JSONL summary is emitted
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            report_future = None
+            if html_enabled:
+                from datetime import datetime as dt
+
+                timestamp = dt.now().strftime("%Y%m%d_%H%M")
+
+                # Determine report directory for F03 (map) reports
+                if hasattr(args, "html_dir") and args.html_dir:
+                    reports_dir = Path(args.html_dir)
+                else:
+                    reports_dir = root_path / "data" / "05_map"
+
+                # Generate enriched summary for HTML report
+                html_summary = {
+                    "step": "map",
+                    "object": args.object,
+                    "variant": args.variant,
+                    "ts": dt.now().isoformat(),
+                    "source_index": str(source_index_file.relative_to(Path(args.root))),
+                    "target_index": str(target_index_file.relative_to(Path(args.root))),
+                    "mapped": mapped_count,
+                    "unmapped": unmapped_count,
+                    "to_audit": to_audit_count,
+                    "unused_sources": unused_sources_count,
+                    "mappings": html_mappings,
+                    "to_audit_rows": [
                         {
-                            "target_table": target.get("target_table", ""),
-                            "target_field": target.get("target_field", str(target)),
-                            "required": target.get("required", False),
+                            "target_table": audit.get("target_table", ""),
+                            "target_field": audit["target_field_name"],
+                            "source_header": audit.get("source_header"),
+                            "confidence": audit.get("confidence", 0.0),
+                            "reason": audit.get("reason", ""),
                         }
-                        if isinstance(target, dict)
-                        else {"target_field": str(target), "required": False}
-                    )
-                    for target in mapping_result["unmapped_target_fields"]
-                ],
-                "coverage_stats": {
-                    "total_mappings": len(mapping_result["mappings"]),
-                    "mapped_with_source": mapped_count,
-                    "unmapped_count": unmapped_count,
-                    "unmapped_sources_count": unused_sources_count,
-                    "unmapped_targets_count": len(
-                        mapping_result["unmapped_target_fields"]
-                    ),
-                    "coverage_pct": round(
+                        for audit in mapping_result["to_audit"]
+                    ],
+                    "unmapped_source_fields": mapping_result["unmapped_source_fields"],
+                    "unmapped_target_fields": [
                         (
-                            (mapped_count / len(mapping_result["mappings"]) * 100)
-                            if len(mapping_result["mappings"]) > 0
-                            else 0.0
+                            {
+                                "target_table": target.get("target_table", ""),
+                                "target_field": target.get("target_field", str(target)),
+                                "required": target.get("required", False),
+                            }
+                            if isinstance(target, dict)
+                            else {"target_field": str(target), "required": False}
+                        )
+                        for target in mapping_result["unmapped_target_fields"]
+                    ],
+                    "coverage_stats": {
+                        "total_mappings": len(mapping_result["mappings"]),
+                        "mapped_with_source": mapped_count,
+                        "unmapped_count": unmapped_count,
+                        "unmapped_sources_count": unused_sources_count,
+                        "unmapped_targets_count": len(
+                            mapping_result["unmapped_target_fields"]
                         ),
-                        2,
-                    ),
-                },
-                "warnings": [],
-            }
+                        "coverage_pct": round(
+                            (
+                                mapped_count / len(mapping_result["mappings"]) * 100
+                                if len(mapping_result["mappings"]) > 0
+                                else 0.0
+                            ),
+                            2,
+                        ),
+                    },
+                    "warnings": [],
+                }
 
-            # Write JSON summary
-            json_filename = (
-                f"{args.object}_{args.variant}_mapping_report_{timestamp}.json"
-            )
-            json_path = reports_dir / json_filename
-            json_path.parent.mkdir(parents=True, exist_ok=True)
+                json_filename = (
+                    f"{args.object}_{args.variant}_mapping_report_{timestamp}.json"
+                )
+                json_path = reports_dir / json_filename
+                html_filename = (
+                    f"{args.object}_{args.variant}_mapping_report_{timestamp}.html"
+                )
+                html_path = reports_dir / html_filename
+                title = f"Mapping Report · {args.object}/{args.variant}"
 
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(html_summary, f, ensure_ascii=False, indent=2)
+                def write_report_files():
+                    # Write JSON summary
+                    json_path.parent.mkdir(parents=True, exist_ok=True)
+                    with open(json_path, "wb") as f:
+                        f.write(_dumps_json(html_summary))
 
-            # Write HTML report
-            html_filename = (
-                f"{args.object}_{args.variant}_mapping_report_{timestamp}.html"
-            )
-            html_path = reports_dir / html_filename
-            title = f"Mapping Report · {args.object}/{args.variant}"
+                    # Write HTML report
+                    write_html_report(html_summary, html_path, title)
 
-            write_html_report(html_summary, html_path, title)
+                report_future = executor.submit(write_report_files)
 
-            # Human-readable logging with forward slashes
-            html_path_display = str(html_path.relative_to(Path(args.root))).replace(
-                "\\", "/"
-            )
-            if not (args.json or not sys.stdout.isatty()):
-                print(f"report: {html_path_display}")
+            # Log event using Enhanced Logger (handles both stdout and file logging)
+            logger.log_event(summary_data, preview_data)
+
+            if report_future is not None:
+                # Re-raises any error from the report thread
+                report_future.result()
+
+                # Human-readable logging with forward slashes
+                html_path_display = html_path.relative_to(Path(args.root)).as_posix()
+                if not (args.json or not sys.stdout.isatty()):
+                    print(f"report: {html_path_display}")
 
     except Exception as e:
         error_data = {"error": "exception", "message": str(e)}
@@ -2921,18 +3308,38 @@ def run_transform_command(args, config):
     """Run the transform command - transforms raw data through ETL pipeline to SAP CSV."""
     import csv
     import glob
-    import re
+    import os
     import time
-    from datetime import datetime
+
+    import numpy as np
+    import pandas as pd
 
     from .enhanced_logging import EnhancedLogger
+    from .reporting import (
+        generate_mapping_report_with_samples,
+        profile_dataframe,
+        write_html_report,
+    )
 
     start_time = time.time()
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+    # Checked once; console output below and the machine-mode gate both use it
+    is_tty = sys.stdout.isatty()
+    # One clock read per run: file stamps and report "ts" values all derive from it
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M")
+    ts_iso = now.isoformat()
 
     # Track warnings for final summary
     warnings = []
 
+    # HTML reports (and the summaries that feed them) are only built when enabled.
+    # In machine mode (--json with redirected stdout) nobody opens them, so they
+    # are skipped there unless --force-html is given.
+    machine_mode = args.json and not is_tty
+    html_enabled = not getattr(args, "no_html", False) and (
+        not machine_mode or getattr(args, "force_html", False)
+    )
+
     logger.info(f"=== Transform Command: {args.object}/{args.variant} ===")
 
     # Set up paths using root directory
@@ -3028,9 +3435,11 @@ def run_transform_command(args, config):
     try:
         # Load raw data
         logger.info("Loading raw XLSX data...")
-        raw_df = pd.read_excel(raw_file, dtype=str)
-        # Replace NaN with empty strings and trim
-        raw_df = raw_df.fillna("").astype(str)
+        # na_filter=False yields empty strings for blank cells directly, so no
+        # fillna/astype copy of the whole frame is needed before trimming
+        raw_df = pd.read_excel(
+            raw_file, dtype=str, na_filter=False, keep_default_na=False
+        )
         for col in raw_df.columns:
             raw_df[col] = raw_df[col].str.strip()
 
@@ -3038,9 +3447,8 @@ def run_transform_command(args, config):
         logger.info(f"Loaded {rows_in} rows from raw data")
 
         # Load and validate mapping configuration
-        with open(mapping_file, encoding="utf-8") as f:
-            mapping_data = yaml.safe_load(f)
-        
+        mapping_data = _load_yaml(mapping_file)
+
         try:
             validate_mapping(mapping_data)
             logger.debug(f"Mapping from {mapping_file} validated successfully")
@@ -3049,9 +3457,8 @@ def run_transform_command(args, config):
             raise
 
         # Load and validate target index
-        with open(target_index_file, encoding="utf-8") as f:
-            target_data = yaml.safe_load(f)
-        
+        target_data = _load_yaml(target_index_file)
+
         try:
             validate_index_target(target_data)
             logger.debug(f"Target index from {target_index_file} validated successfully")
@@ -3072,8 +3479,7 @@ def run_transform_command(args, config):
 
         validation_config = {}
         if validation_file.exists():
-            with open(validation_file, encoding="utf-8") as f:
-                validation_config = yaml.safe_load(f) or {}
+            validation_config = _load_yaml(validation_file) or {}
 
         # Template processing
         template_path = None
@@ -3134,20 +3540,20 @@ def run_transform_command(args, config):
                     }
                 )
 
-        # Save raw validation
-        raw_stats_df = pd.DataFrame(raw_stats)
-        raw_stats_df.to_csv(raw_validation_file, index=False)
+        # Save raw validation (stream the stat dicts, no DataFrame round-trip)
+        with open(raw_validation_file, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(
+                f,
+                fieldnames=["source_header", "total", "empty_count", "pct_empty"],
+                lineterminator=os.linesep,
+            )
+            writer.writeheader()
+            writer.writerows(raw_stats)
         with open(raw_validation_json, "w", encoding="utf-8") as f:
             json.dump(raw_stats, f, indent=2)
 
         # Generate HTML report for RAW validation if enabled
-        if not getattr(args, "no_html", False):
-            from datetime import datetime as dt
-
-            from .reporting import write_html_report
-
-            timestamp_html = dt.now().strftime("%Y%m%d_%H%M")
-
+        if html_enabled:
             # Determine report directory for RAW validation
             if hasattr(args, "html_dir") and args.html_dir:
                 reports_dir = Path(args.html_dir)
@@ -3165,15 +3571,13 @@ def run_transform_command(args, config):
             ]
 
             # Add data profiling for RAW validation
-            from .reporting import profile_dataframe
-
             raw_profiles = profile_dataframe(raw_df)
 
             html_summary_raw = {
                 "step": "raw_validation",
                 "object": args.object,
                 "variant": args.variant,
-                "ts": dt.now().isoformat(),
+                "ts": ts_iso,
                 "rows_in": len(raw_df),
                 "null_rate_by_source": null_rate_by_source,
                 "missing_sources": missing_sources,
@@ -3185,7 +3589,7 @@ def run_transform_command(args, config):
 
             # Write JSON summary for RAW validation
             json_filename_raw = (
-                f"raw_validation_{args.object}_{args.variant}_{timestamp_html}.json"
+                f"raw_validation_{args.object}_{args.variant}_{timestamp}.json"
             )
             json_path_raw = reports_dir / json_filename_raw
             json_path_raw.parent.mkdir(parents=True, exist_ok=True)
@@ -3195,7 +3599,7 @@ def run_transform_command(args, config):
 
             # Write HTML report for RAW validation
             html_filename_raw = (
-                f"raw_validation_{args.object}_{args.variant}_{timestamp_html}.html"
+                f"raw_validation_{args.object}_{args.variant}_{timestamp}.html"
             )
             html_path_raw = reports_dir / html_filename_raw
             title_raw = f"raw_validation · {args.object}/{args.variant}"
@@ -3203,10 +3607,8 @@ def run_transform_command(args, config):
             write_html_report(html_summary_raw, html_path_raw, title_raw)
 
             # Human-readable logging with forward slashes
-            html_path_display_raw = str(html_path_raw.relative_to(root_path)).replace(
-                "\\", "/"
-            )
-            if not (args.json or not sys.stdout.isatty()):
+            html_path_display_raw = html_path_raw.relative_to(root_path).as_posix()
+            if not (args.json or not is_tty):
                 print(f"report: {html_path_display_raw}")
 
         # 3) Create skeleton DataFrame with target field base names
@@ -3222,9 +3624,9 @@ def run_transform_command(args, config):
                 skeleton_columns[base_name.lower()] = base_name
 
         # Initialize skeleton with all target columns (lowercase keys, empty values)
-        skeleton = pd.DataFrame(index=raw_df.index)
-        for col_lower in skeleton_columns:
-            skeleton[col_lower] = ""
+        skeleton = pd.DataFrame(
+            "", index=raw_df.index, columns=list(skeleton_columns), dtype=object
+        )
 
         logger.info(
             f"After init: skeleton shape={skeleton.shape}, columns={list(skeleton.columns)[:5]}..."
@@ -3233,32 +3635,43 @@ def run_transform_command(args, config):
         # 4) Fill skeleton from mapping
         logger.info("Filling skeleton from mapping...")
 
+        # Resolve target -> source first (a source may feed several targets and a
+        # later mapping for the same target wins), then copy all columns at once
+        target_sources = {}
         mapping_applied = 0
         mapping_skipped = 0
-        for _idx, mapping in enumerate(mapping_entries):
+        total_mapped_fields = 0  # mappings with a source, for mapped_coverage
+        for mapping in mapping_entries:
             # Support both old format (target_field) and new format (target_field_name)
             target_field = mapping.get("target_field", "") or mapping.get(
                 "target_field_name", ""
             )
             source_header = mapping.get("source_header")
+            if source_header:
+                total_mapped_fields += 1
 
             if target_field and source_header:
                 target_base = target_field.upper()
                 target_lower = target_base.lower()
 
-                if target_lower in skeleton.columns:
+                if target_lower in skeleton_columns:
                     if source_header in raw_df.columns:
-                        skeleton[target_lower] = raw_df[source_header]
+                        target_sources[target_lower] = source_header
                         mapping_applied += 1
                     else:
-                        # Already warned about missing source column
-                        skeleton[target_lower] = ""
+                        # Already warned about missing source column; stays empty
+                        target_sources.pop(target_lower, None)
                         mapping_skipped += 1
                 else:
                     mapping_skipped += 1
             else:
                 mapping_skipped += 1
 
+        if target_sources:
+            skeleton.loc[:, list(target_sources)] = raw_df[
+                list(target_sources.values())
+            ].to_numpy()
+
         # 5) Apply transformations (basic implementation)
         logger.info("Applying transformations...")
         # If transform.yaml is empty/templates, skeleton is already the transformed data
@@ -3316,7 +3729,7 @@ def run_transform_command(args, config):
                         "field": base_name,
                         "issue": "key=true but required=false",
                     }
-                    if args.json or not sys.stdout.isatty():
+                    if args.json or not is_tty:
                         print(json.dumps(error_data))
                     else:
                         logger.error(
@@ -3324,50 +3737,74 @@ def run_transform_command(args, config):
                         )
                     sys.exit(6)
 
-        # Apply validation rules
-        rejected_rows = []
-        error_stats = {}
-
-        for idx, row in skeleton.iterrows():
-            row_errors = []
-
-            for col_lower, base_name in skeleton_columns.items():
-                value = row[col_lower]
-                config = key_required_config.get(base_name, {})
-
-                # Required validation
-                if config.get("required", False) and value == "":
-                    error_label = f"{base_name}.required"
-                    row_errors.append(error_label)
-                    error_stats[error_label] = error_stats.get(error_label, 0) + 1
+        # Flatten the key/required flags into sets for O(1) membership tests
+        required_fields = {
+            name for name, rules in key_required_config.items() if rules.get("required")
+        }
+        key_fields = {
+            name for name, rules in key_required_config.items() if rules.get("key")
+        }
 
-                # TODO: Add other validation rules (regex, max_length, type, etc.)
+        # Apply validation rules: one boolean mask per (column, rule) in
+        # column order, OR-ed into a single rejected-rows mask
+        rule_masks = []  # (error_label, mask over skeleton rows)
+        for col_lower, base_name in skeleton_columns.items():
+            # Required validation
+            if base_name in required_fields:
+                mask = (skeleton[col_lower] == "").to_numpy()
+                if mask.any():
+                    rule_masks.append((f"{base_name}.required", mask))
+
+            # TODO: Add other validation rules (regex, max_length, type, etc.)
+
+        rejected_mask = np.zeros(len(skeleton), dtype=bool)
+        for _, mask in rule_masks:
+            rejected_mask |= mask
+
+        # Errors per rejected row, in column order
+        row_errors_by_index = {}
+        index_labels = skeleton.index.tolist()
+        for position in np.flatnonzero(rejected_mask).tolist():
+            row_errors_by_index[index_labels[position]] = [
+                error_label for error_label, mask in rule_masks if mask[position]
+            ]
 
-            if row_errors:
-                rejected_rows.append(
-                    {
-                        "__rownum": idx + 1,
-                        "__errors": "|".join(row_errors),
-                        "__first_error": row_errors[0],
-                        "__timestamp": datetime.now().isoformat(),
-                        **{skeleton_columns[col]: row[col] for col in skeleton.columns},
-                    }
-                )
+        # Counts per rule, ordered by first occurrence (row by row, then column)
+        first_hits = sorted(
+            (int(mask.argmax()), column, error_label, int(mask.sum()))
+            for column, (error_label, mask) in enumerate(rule_masks)
+        )
+        error_stats = {error_label: count for _, _, error_label, count in first_hits}
 
         # Split into accepted and rejected
-        rejected_indices = [r["__rownum"] - 1 for r in rejected_rows]
+        rejected_indices = list(row_errors_by_index)
         accepted_skeleton = (
             skeleton.drop(index=rejected_indices)
             if rejected_indices
             else skeleton.copy()
         )
 
-        logger.info(
-            f"Validation results: skeleton rows={len(skeleton)}, rejected={len(rejected_rows)}, accepted={len(accepted_skeleton)}"
+        # Build the rejected frame in one go from the skeleton rows
+        rejected_df = skeleton.loc[rejected_indices].rename(columns=skeleton_columns)
+        rejected_df.insert(0, "__rownum", rejected_df.index + 1)
+        rejected_df.insert(
+            1,
+            "__errors",
+            ["|".join(errors) for errors in row_errors_by_index.values()],
+        )
+        rejected_df.insert(
+            2,
+            "__first_error",
+            [errors[0] for errors in row_errors_by_index.values()],
         )
+        rejected_df.insert(3, "__timestamp", ts_iso)
 
         rows_out = len(accepted_skeleton)
-        rows_rejected = len(rejected_rows)
+        rows_rejected = len(rejected_df)
+
+        logger.info(
+            f"Validation results: skeleton rows={len(skeleton)}, rejected={rows_rejected}, accepted={rows_out}"
+        )
 
         # 8) Template processing and column annotation
         logger.info("Processing template and applying annotations...")
@@ -3379,7 +3816,7 @@ def run_transform_command(args, config):
         if template_headers:
             for header in template_headers:
                 # Strip annotation to get base name
-                base_match = re.match(r"^([^()]+)", header.strip())
+                base_match = _BASE_NAME_RE.match(header.strip())
                 if base_match:
                     base_name = base_match.group(1).upper()
                     template_map[base_name] = header
@@ -3393,30 +3830,27 @@ def run_transform_command(args, config):
                     final_column_order.append(base_name)
 
         # Check template vs targets reconciliation
+        has_template = bool(template_headers)
         for base_name in skeleton_columns.values():
-            if base_name not in template_map and template_headers:
+            if has_template and base_name not in template_map:
                 warnings.append(
                     {"warning": "target_not_in_template", "field": base_name}
                 )
                 ignored_targets.append(base_name)
+        ignored_target_set = set(ignored_targets)
 
         # Apply correct annotation based on validation config
         final_headers = []
-        final_data = pd.DataFrame(
-            index=accepted_skeleton.index
-        )  # Initialize with same index!
+        final_columns = {}  # annotated_header -> Series (or "" when missing)
 
-        logger.info(
-            f"Before loop: final_data shape={final_data.shape}, accepted_skeleton shape={accepted_skeleton.shape}"
-        )
+        logger.info(f"Before loop: accepted_skeleton shape={accepted_skeleton.shape}")
 
         for base_name in final_column_order:
-            if base_name in ignored_targets:
+            if base_name in ignored_target_set:
                 continue  # Skip fields not in template
 
-            config = key_required_config.get(base_name, {})
-            key = config.get("key", False)
-            required = config.get("required", False)
+            key = base_name in key_fields
+            required = base_name in required_fields
 
             # Annotation rules
             if key and required:
@@ -3428,56 +3862,40 @@ def run_transform_command(args, config):
 
             final_headers.append(annotated_header)
 
-            # Get data from skeleton - ensure we get the data even if column names don't match exactly
+            # Get data from skeleton
             col_lower = base_name.lower()
             if col_lower in accepted_skeleton.columns:
-                final_data[annotated_header] = accepted_skeleton[col_lower]
-            elif base_name.lower() in accepted_skeleton.columns:
-                final_data[annotated_header] = accepted_skeleton[base_name.lower()]
+                final_columns[annotated_header] = accepted_skeleton[col_lower]
             else:
                 # Column doesn't exist in skeleton - fill with empty
                 logger.warning(
                     f"Column {base_name} not found in skeleton, filling with empty"
                 )
-                final_data[annotated_header] = ""
+                final_columns[annotated_header] = ""
+
+        # Build the output frame in one go (same index as accepted_skeleton)
+        final_data = pd.DataFrame(final_columns, index=accepted_skeleton.index)
+        # Column labels read once for the report sample and console preview
+        final_cols_list = final_data.columns.tolist()
 
         # 9) Write Snapshot CSV only (removing SAP CSV generation as per requirement 4)
         logger.info("Writing snapshot CSV...")
 
-        def write_sap_csv(df, filepath):
-            """Write CSV with SAP requirements: UTF-8, CRLF, proper quoting"""
-            with open(filepath, "w", encoding="utf-8", newline="") as f:
-                writer = csv.writer(
-                    f,
-                    delimiter=",",
-                    quotechar='"',
-                    lineterminator="\r\n",
-                    quoting=csv.QUOTE_MINIMAL,
-                )
-                # Write headers
-                writer.writerow(final_headers)
-                # Write data rows
-                for idx, row in df.iterrows():
-                    try:
-                        # Build row data matching final_headers column order
-                        row_data = []
-                        for col in final_headers:
-                            if col in df.columns:
-                                row_data.append(row[col])
-                            else:
-                                row_data.append("")
-                        writer.writerow(row_data)
-                    except Exception as e:
-                        logger.error(f"Error writing row {idx}: {e}")
-                        raise
-
         # Write only snapshot CSV (timestamped format: S_{variant}#{object}_{timestamp}_output.csv)
         # This format is accepted by SAP Migrate Your Data as long as S_ prefix and # separator are used
-        write_sap_csv(final_data, snapshot_csv)
+        # SAP requirements: UTF-8, CRLF, minimal quoting
+        final_data.to_csv(
+            snapshot_csv,
+            index=False,
+            encoding="utf-8",
+            lineterminator="\r\n",
+            quoting=csv.QUOTE_MINIMAL,
+            quotechar='"',
+            columns=final_headers,
+        )
 
         # Write rejected records
-        if rejected_rows:
-            rejected_df = pd.DataFrame(rejected_rows)
+        if rows_rejected:
             rejected_df.to_csv(rejects_csv, index=False)
 
             # Generate HTML report for rejected records
@@ -3504,6 +3922,25 @@ def run_transform_command(args, config):
             / f"post_transform_validation_{args.object}_{args.variant}_{timestamp}.json"
         )
 
+        # Profile the skeleton (transformed target columns before splitting) on a
+        # worker thread while post_stats is aggregated and written
+        post_profiles_future = None
+        if html_enabled:
+            # Prepare validation rules mapping for profiler
+            validation_rules_mapping = dict(
+                zip(
+                    map(str.lower, validation_config),
+                    validation_config.values(),
+                    strict=True,
+                )
+            )
+            profile_executor = ThreadPoolExecutor(max_workers=1)
+            post_profiles_future = profile_executor.submit(
+                profile_dataframe, skeleton, validation_rules_mapping
+            )
+            # No further work is queued; the worker exits once profiling is done
+            profile_executor.shutdown(wait=False)
+
         post_stats = {
             "rows_in": rows_in,
             "rows_out": rows_out,
@@ -3512,35 +3949,34 @@ def run_transform_command(args, config):
             "errors_by_field": {},
         }
 
-        # Group errors by field
-        for error_label in error_stats:
-            field_name = error_label.split(".")[0]
-            post_stats["errors_by_field"][field_name] = (
-                post_stats["errors_by_field"].get(field_name, 0)
-                + error_stats[error_label]
-            )
+        # Group errors by field (pandas groupby pays off for large label sets)
+        if len(error_stats) > 512:
+            error_counts = pd.Series(error_stats)
+            fields = error_counts.index.str.split(".", n=1).str[0]
+            post_stats["errors_by_field"] = {
+                field_name: int(count)
+                for field_name, count in error_counts.groupby(fields, sort=False)
+                .sum()
+                .items()
+            }
+        else:
+            errors_by_field = Counter()
+            for error_label, count in error_stats.items():
+                errors_by_field[error_label.split(".", 1)[0]] += count
+            post_stats["errors_by_field"] = dict(errors_by_field)
 
-        with open(post_transform_json, "w", encoding="utf-8") as f:
-            json.dump(post_stats, f, indent=2)
+        # Compact JSON for --json (machine) runs, indented for humans
+        post_transform_json.write_bytes(_dumps_json(post_stats, pretty=not args.json))
 
         # Generate HTML report for POST-transform validation if enabled
-        if not getattr(args, "no_html", False):
-            from datetime import datetime as dt
-
-            from .reporting import write_html_report
-
-            timestamp_html = dt.now().strftime("%Y%m%d_%H%M")
-
+        if html_enabled:
             # Determine report directory for POST validation
             if hasattr(args, "html_dir") and args.html_dir:
                 reports_dir = Path(args.html_dir)
             else:
                 reports_dir = transformed_validation_dir
 
-            # Calculate mapped coverage
-            total_mapped_fields = len(
-                [m for m in mapping_entries if m.get("source_header")]
-            )
+            # Calculate mapped coverage (total_mapped_fields counted during the fill)
             total_target_fields = len(target_fields)
             mapped_coverage = (
                 total_mapped_fields / total_target_fields
@@ -3551,33 +3987,33 @@ def run_transform_command(args, config):
             # Generate sample rows with errors
             sample_rows = []
             if len(final_data) > 0:
-                error_sample = final_data.head(200)  # Take first 200 rows
-                for idx, row in error_sample.iterrows():
-                    row_dict = {"__rownum": idx + 1}
-                    # Add top 3 target fields as sample
-                    target_sample = list(final_data.columns)[:3]
-                    for col in target_sample:
-                        row_dict[col] = str(row[col]) if pd.notna(row[col]) else ""
-
-                    # Add errors (simplified - could be enhanced with actual validation)
-                    row_errors = []
-                    for col in target_sample:
-                        if pd.isna(row[col]) or str(row[col]).strip() == "":
-                            row_errors.append(f"{col}.required")
-                    row_dict["errors"] = row_errors
-                    sample_rows.append(row_dict)
-
-            # Add data profiling for POST-transform validation (on skeleton before split)
-            from .reporting import profile_dataframe
-
-            # Prepare validation rules mapping for profiler
-            validation_rules_mapping = {}
-            if validation_config:
-                for field_name, rules in validation_config.items():
-                    validation_rules_mapping[field_name.lower()] = rules
+                # Top 3 target fields of the first 200 rows as sample; slice rows
+                # and columns together so only the 200x3 window is copied
+                target_sample = final_cols_list[:3]
+                error_sample = final_data.iloc[:200, :3].fillna("").astype(str)
+
+                # Add errors (simplified - could be enhanced with actual validation)
+                error_labels = [f"{col}.required" for col in target_sample]
+                missing = error_sample.apply(
+                    lambda column: column.str.strip() == ""
+                ).to_numpy()
+
+                for idx, record, row_missing in zip(
+                    error_sample.index,
+                    error_sample.to_dict("records"),
+                    missing,
+                    strict=True,
+                ):
+                    sample_rows.append(
+                        {
+                            "__rownum": idx + 1,
+                            **record,
+                            "errors": list(compress(error_labels, row_missing)),
+                        }
+                    )
 
-            # Profile the skeleton (transformed target columns before splitting)
-            post_profiles = profile_dataframe(skeleton, validation_rules_mapping)
+            # Data profiling for POST-transform validation (submitted above)
+            post_profiles = post_profiles_future.result()
 
             # Generate enriched summary for POST-transform validation HTML report
             html_summary_post = {
@@ -3585,7 +4021,7 @@ def run_transform_command(args, config):
                 "object": args.object,
                 "variant": args.variant,
                 "structure": f"S_{args.variant.upper()}",
-                "ts": dt.now().isoformat(),
+                "ts": ts_iso,
                 "rows_in": rows_in,
                 "rows_out": rows_out,
                 "rows_rejected": rows_rejected,
@@ -3601,38 +4037,28 @@ def run_transform_command(args, config):
             }
 
             # Write JSON summary for POST validation
-            json_filename_post = f"post_transform_validation_{args.object}_{args.variant}_{timestamp_html}.json"
+            json_filename_post = f"post_transform_validation_{args.object}_{args.variant}_{timestamp}.json"
             json_path_post = reports_dir / json_filename_post
             json_path_post.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(json_path_post, "w", encoding="utf-8") as f:
-                json.dump(html_summary_post, f, ensure_ascii=False, indent=2)
+            json_path_post.write_bytes(
+                _dumps_json(html_summary_post, pretty=not args.json)
+            )
 
             # Write HTML report for POST validation
-            html_filename_post = f"post_transform_validation_{args.object}_{args.variant}_{timestamp_html}.html"
+            html_filename_post = f"post_transform_validation_{args.object}_{args.variant}_{timestamp}.html"
             html_path_post = reports_dir / html_filename_post
             title_post = f"post_transform_validation · S_{args.variant.upper()} · {args.object}/{args.variant}"
 
             write_html_report(html_summary_post, html_path_post, title_post)
 
             # Human-readable logging with forward slashes
-            html_path_display_post = str(html_path_post.relative_to(root_path)).replace(
-                "\\", "/"
-            )
-            if not (args.json or not sys.stdout.isatty()):
+            html_path_display_post = html_path_post.relative_to(root_path).as_posix()
+            if not (args.json or not is_tty):
                 print(f"report: {html_path_display_post}")
 
         # Generate mapping report with sample values
-        if not getattr(args, "no_html", False):
-            from datetime import datetime as dt
-
-            from .reporting import (
-                generate_mapping_report_with_samples,
-                write_html_report,
-            )
-
-            timestamp_mapping = dt.now().strftime("%Y%m%d_%H%M")
-
+        if html_enabled:
             # Determine report directory for mapping reports (F05)
             if hasattr(args, "html_dir") and args.html_dir:
                 reports_dir = Path(args.html_dir)
@@ -3676,12 +4102,10 @@ def run_transform_command(args, config):
                 "step": "transform",
                 "object": args.object,
                 "variant": args.variant,
-                "ts": dt.now().isoformat(),
-                "source_index": str(migrations_dir / "index_source.yaml").replace(
-                    "\\", "/"
-                ),
-                "target_index": str(target_index_file).replace("\\", "/"),
-                "mapping_file": str(mapping_file).replace("\\", "/"),
+                "ts": ts_iso,
+                "source_index": _posix(migrations_dir / "index_source.yaml"),
+                "target_index": _posix(target_index_file),
+                "mapping_file": _posix(mapping_file),
                 "mappings": mapping_report["mappings"],
                 "coverage_stats": mapping_report["coverage_stats"],
                 "unmapped_source_fields": mapping_report["unmapped_source_fields"],
@@ -3691,7 +4115,7 @@ def run_transform_command(args, config):
 
             # Write JSON summary
             json_filename_mapping = (
-                f"{args.object}_{args.variant}_mapping_report_{timestamp_mapping}.json"
+                f"{args.object}_{args.variant}_mapping_report_{timestamp}.json"
             )
             json_path_mapping = reports_dir / json_filename_mapping
             json_path_mapping.parent.mkdir(parents=True, exist_ok=True)
@@ -3701,7 +4125,7 @@ def run_transform_command(args, config):
 
             # Write HTML report
             html_filename_mapping = (
-                f"{args.object}_{args.variant}_mapping_report_{timestamp_mapping}.html"
+                f"{args.object}_{args.variant}_mapping_report_{timestamp}.html"
             )
             html_path_mapping = reports_dir / html_filename_mapping
             title_mapping = f"Mapping Report · {args.object}/{args.variant}"
@@ -3709,10 +4133,10 @@ def run_transform_command(args, config):
             write_html_report(html_summary_mapping, html_path_mapping, title_mapping)
 
             # Human-readable logging with forward slashes
-            html_path_display_mapping = str(
-                html_path_mapping.relative_to(root_path)
-            ).replace("\\", "/")
-            if not (args.json or not sys.stdout.isatty()):
+            html_path_display_mapping = html_path_mapping.relative_to(
+                root_path
+            ).as_posix()
+            if not (args.json or not is_tty):
                 print(f"report: {html_path_display_mapping}")
 
         # Calculate final metrics
@@ -3729,7 +4153,7 @@ def run_transform_command(args, config):
             "template_glob": template_glob,
             "template_used": template_path,
             "snapshot_csv": str(snapshot_csv),
-            "rejects_csv": str(rejects_csv) if rejected_rows else None,
+            "rejects_csv": str(rejects_csv) if rows_rejected else None,
             "ignored_targets": ignored_targets,
             "rows_in": rows_in,
             "rows_out": rows_out,
@@ -3741,14 +4165,14 @@ def run_transform_command(args, config):
         # Prepare preview data for enhanced logger (first 8 columns, 5 rows)
         preview_data = []
         if len(final_data) > 0:
-            preview_cols = final_headers[:8]
-            preview_df = final_data[preview_cols].head(5)
-
-            for _idx, row in preview_df.iterrows():
-                row_dict = {}
-                for col in preview_cols:
-                    row_dict[col] = str(row[col])[:15] if pd.notna(row[col]) else ""
-                preview_data.append(row_dict)
+            preview_cols = final_cols_list[:8]
+            preview_df = final_data.head(5)[preview_cols]
+            preview_data = (
+                preview_df.where(preview_df.notna(), "")
+                .astype(str)
+                .apply(lambda column: column.str.slice(0, 15))
+                .to_dict("records")
+            )
 
         # Log event using Enhanced Logger (this will handle both stdout and file logging)
         enhanced_logger.log_event(summary, preview_data)
@@ -3761,6 +4185,15 @@ def run_transform_command(args, config):
         sys.exit(1)
 
 
+# Subcommand name -> handler(args, config)
+COMMANDS = {
+    "index_source": run_index_source_command,
+    "index_target": run_index_target_command,
+    "map": run_map_command,
+    "transform": run_transform_command,
+}
+
+
 def main():
     """Main entry point for the application."""
     from .logging_config import setup_logging
@@ -3771,17 +4204,11 @@ def main():
     args, config, is_legacy = setup_cli()
 
     # Execute the appropriate command
-    if args.command == "index_source":
-        run_index_source_command(args, config)
-    elif args.command == "index_target":
-        run_index_target_command(args, config)
-    elif args.command == "map":
-        run_map_command(args, config)
-    elif args.command == "transform":
-        run_transform_command(args, config)
-    else:
+    handler = COMMANDS.get(args.command)
+    if handler is None:
         logger.error(f"Unknown command: {args.command}")
         sys.exit(1)
+    handler(args, config)
 
 
 if __name__ == "__main__":
@@ -13,6 +13,11 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 
+# lxml (libxml2) parses SpreadsheetML noticeably faster than ElementTree
+from lxml import etree as _lxml_etree
+
+_XML_PARSE_ERRORS = (ET.ParseError, _lxml_etree.XMLSyntaxError)
+
 
 def read_excel_headers(
     path: Path,
@@ -95,20 +100,29 @@ def read_excel_target_fields(
             "sap_field": ["SAP Field", "sap_field", "Field"],
         }
 
-        # Find actual column names in the DataFrame
+        # Find actual column names in the DataFrame: the first exact name,
+        # else the leftmost column matching any name case-insensitively
+        column_set = set(df.columns)
+        column_by_lower = {}  # lowercased header -> (position, column)
+        for position, col in enumerate(df.columns):
+            if isinstance(col, str):
+                column_by_lower.setdefault(col.lower(), (position, col))
+
         actual_columns = {}
         for field_name, possible_names in column_mapping.items():
-            for possible_name in possible_names:
-                if possible_name in df.columns:
-                    actual_columns[field_name] = possible_name
-                    break
+            exact = next((name for name in possible_names if name in column_set), None)
+            if exact is not None:
+                actual_columns[field_name] = exact
+                continue
 
             # If not found, try case-insensitive match
-            if field_name not in actual_columns:
-                for col in df.columns:
-                    if any(col.lower() == name.lower() for name in possible_names):
-                        actual_columns[field_name] = col
-                        break
+            matches = [
+                column_by_lower[name.lower()]
+                for name in possible_names
+                if name.lower() in column_by_lower
+            ]
+            if matches:
+                actual_columns[field_name] = min(matches)[1]
 
         # Verify we have the essential columns
         required_fields = ["field_description", "sap_field"]
@@ -118,27 +132,54 @@ def read_excel_target_fields(
                     f"Required column not found for '{field}'. Available columns: {list(df.columns)}"
                 )
 
+        # Pull each column out once as a plain list (iterating those avoids
+        # a Series per row); unresolved columns give their default per row
+        def column(field_name: str, default: Any = None) -> list:
+            if field_name in actual_columns:
+                return df[actual_columns[field_name]].tolist()
+            return [default] * len(df)
+
         # Convert DataFrame to target field format
         target_fields = []
-        for index, row in df.iterrows():
+        for field_count, (
+            sap_field,
+            field_description,
+            sap_table,
+            importance,
+            field_group,
+            sheet_name,
+            data_type,
+            length_val,
+            decimal_val,
+        ) in enumerate(
+            zip(
+                column("sap_field"),
+                column("field_description"),
+                column("sap_table", variant),
+                column("importance", ""),
+                column("field_group", ""),
+                column("sheet_name", "Field List"),
+                column("data_type", "Text"),
+                column("length", ""),
+                column("decimal", ""),
+                strict=True,
+            ),
+            start=1,
+        ):
             # Extract importance/mandatory status
-            importance = row.get(actual_columns.get("importance", ""), "").strip()
+            importance = importance.strip()
             mandatory = importance.lower() in ["mandatory", "true", "1", "yes"]
 
             # Determine if field is a key (typically mandatory + in key group)
-            field_group = (
-                row.get(actual_columns.get("field_group", ""), "").strip().lower()
-            )
+            field_group = field_group.strip().lower()
             key = mandatory and field_group == "key"
 
-            # Handle decimal values
-            decimal_val = row.get(actual_columns.get("decimal", ""), "")
-            if pd.isna(decimal_val) or decimal_val == "" or decimal_val == "None":
+            # Handle decimal values (NaN is the only value unequal to itself)
+            if decimal_val != decimal_val or decimal_val in ("", "None"):
                 decimal_val = None
 
             # Handle length values
-            length_val = row.get(actual_columns.get("length", ""), "")
-            if pd.isna(length_val) or length_val == "":
+            if length_val is None or length_val != length_val or length_val == "":
                 length_val = ""
             else:
                 try:
@@ -148,25 +189,17 @@ def read_excel_target_fields(
 
             # Create field dictionary matching XML parser output format
             field_dict = {
-                "sap_field": str(row[actual_columns["sap_field"]]).strip(),
-                "field_description": str(
-                    row[actual_columns["field_description"]]
-                ).strip(),
-                "sap_table": str(
-                    row.get(actual_columns.get("sap_table", ""), variant)
-                ).strip(),
+                "sap_field": str(sap_field).strip(),
+                "field_description": str(field_description).strip(),
+                "sap_table": str(sap_table).strip(),
                 "mandatory": mandatory,
                 "field_group": field_group if field_group else "default",
                 "key": key,
-                "sheet_name": str(
-                    row.get(actual_columns.get("sheet_name", ""), "Field List")
-                ).strip(),
-                "data_type": str(
-                    row.get(actual_columns.get("data_type", ""), "Text")
-                ).strip(),
+                "sheet_name": str(sheet_name).strip(),
+                "data_type": str(data_type).strip(),
                 "length": length_val,
                 "decimal": decimal_val,
-                "field_count": index + 1,
+                "field_count": field_count,
             }
 
             target_fields.append(field_dict)
@@ -182,30 +215,131 @@ def read_excel_target_fields(
 class SpreadsheetMLParser:
     """Parser for SpreadsheetML (Excel 2003 XML) format with namespace support."""
 
+    # Fully qualified (Clark notation) tags and attributes, so lookups skip
+    # ElementTree's prefix:name path parsing
+    _NS = "urn:schemas-microsoft-com:office:spreadsheet"
+    _WS = f"{{{_NS}}}Worksheet"
+    _TABLE = f"{{{_NS}}}Table"
+    _ROW = f"{{{_NS}}}Row"
+    _CELL = f"{{{_NS}}}Cell"
+    _DATA = f"{{{_NS}}}Data"
+    _INDEX = f"{{{_NS}}}Index"
+    _NAME = f"{{{_NS}}}Name"
+
+    # lxml is a required dependency, so it always parses; the ElementTree
+    # path behind this flag only runs when tests set it to False
+    _USE_LXML = True
+
     def __init__(self, path: Path):
-        """Initialize parser with XML file path."""
+        """Initialize parser with XML file path.
+
+        The workbook tree is only built when ``tree``/``root`` (or the
+        element-based helpers) are used; parse_target_fields streams rows.
+        """
         self.path = path
-        self.ns = {"ss": "urn:schemas-microsoft-com:office:spreadsheet"}
-        self.tree = None
-        self.root = None
-        self._load_xml()
+        self.ns = {"ss": self._NS}
+        self._tree = None
+        if not Path(path).exists():
+            raise FileNotFoundError(f"XML file not found: {self.path}")
+
+    @property
+    def tree(self) -> ET.ElementTree:
+        """The parsed workbook, loaded on first use."""
+        if self._tree is None:
+            self._load_xml()
+        return self._tree
+
+    @property
+    def root(self) -> ET.Element:
+        """Root element of the parsed workbook."""
+        return self.tree.getroot()
 
     def _load_xml(self) -> None:
         """Load and parse the XML file."""
         try:
-            self.tree = ET.parse(self.path)
-            self.root = self.tree.getroot()
+            if self._USE_LXML:
+                self._tree = _lxml_etree.parse(str(self.path))
+            else:
+                self._tree = ET.parse(self.path)
         except FileNotFoundError:
             raise FileNotFoundError(f"XML file not found: {self.path}")
         except Exception as e:
             raise Exception(f"Error parsing XML file {self.path}: {e}")
 
+    def _pull_events(self):
+        """
+        Yield ElementTree's (event, element) pairs while reading the file.
+
+        The file is fed to an XMLPullParser in 64 KiB chunks, so events are
+        handled as the bytes arrive instead of after a full read.
+        """
+        parser = ET.XMLPullParser(events=("start", "end"))
+        with open(self.path, "rb") as f:
+            while chunk := f.read(1 << 16):
+                parser.feed(chunk)
+                yield from parser.read_events()
+        parser.close()
+        yield from parser.read_events()
+
+    def _iter_worksheet_rows(self, worksheet_name: str):
+        """
+        Yield the Row elements of the named worksheet while parsing the file.
+
+        Rows are cleared and detached once consumed, so only the current row
+        is held in memory. The whole file is still read, so malformed XML
+        anywhere fails as it would with ET.parse.
+        """
+        worksheet_tag = self._WS
+        table_tag = self._TABLE
+        row_tag = self._ROW
+        name_attr = self._NAME
+
+        if self._USE_LXML:
+            # libxml2 filters the events down to the tags used here in C
+            events = _lxml_etree.iterparse(
+                str(self.path),
+                events=("start", "end"),
+                tag=(worksheet_tag, table_tag, row_tag),
+            )
+        else:
+            events = self._pull_events()
+
+        found = False
+        in_worksheet = False
+        table = None
+        try:
+            for event, elem in events:
+                tag = elem.tag
+                if tag == row_tag:
+                    if event == "start":
+                        continue
+                    if in_worksheet:
+                        yield elem
+                    elem.clear()
+                    # Detach the rows before this one (already consumed)
+                    if table is not None and len(table) > 1 and table[-1] is elem:
+                        del table[:-1]
+                elif tag == table_tag:
+                    table = elem if event == "start" else None
+                elif tag == worksheet_tag:
+                    if event == "start":
+                        in_worksheet = (
+                            not found and elem.get(name_attr, "") == worksheet_name
+                        )
+                        found = found or in_worksheet
+                    else:
+                        in_worksheet = False
+                        elem.clear()
+        except _XML_PARSE_ERRORS as e:
+            raise Exception(f"Error parsing XML file {self.path}: {e}")
+
+        if not found:
+            raise ValueError(f"Worksheet '{worksheet_name}' not found")
+
     def find_worksheet(self, worksheet_name: str) -> Optional[ET.Element]:
         """Find worksheet by name."""
-        worksheets = self.root.findall(".//ss:Worksheet", self.ns)
-        for ws in worksheets:
-            name = ws.get(f'{{{self.ns["ss"]}}}Name', "")
-            if name == worksheet_name:
+        for ws in self.root.iter(self._WS):
+            if ws.get(self._NAME, "") == worksheet_name:
                 return ws
         return None
 
@@ -222,43 +356,42 @@ class SpreadsheetMLParser:
         Returns:
             Row number (0-based) if found, None otherwise
         """
-        rows = worksheet.findall(".//ss:Row", self.ns)
-
         # Convert expected headers to lowercase for comparison
         expected_lower = [h.lower() for h in expected_headers]
 
-        for row_idx, row in enumerate(rows):
-            cells = self._parse_row_cells(row)
-            if len(cells) >= len(expected_headers):
-                # Check if this row contains our expected headers
-                row_headers = [str(cell).lower() if cell else "" for cell in cells]
-
-                # Count exact matches first
-                exact_matches = sum(
-                    1
-                    for expected in expected_lower
-                    if any(expected == actual for actual in row_headers)
-                )
+        for row_idx, row in enumerate(worksheet.iter(self._ROW)):
+            if self._is_header_row(self._parse_row_cells(row), expected_lower):
+                return row_idx
 
-                # Count partial matches
-                partial_matches = sum(
-                    1
-                    for expected in expected_lower
-                    if any(
-                        expected in actual or actual in expected
-                        for actual in row_headers
-                        if actual
-                    )
-                )
+        return None
 
-                # If we have most exact matches or good partial matches, this is our header row
-                if (
-                    exact_matches >= len(expected_headers) * 0.8
-                    or partial_matches >= len(expected_headers) * 0.7
-                ):
-                    return row_idx
+    @staticmethod
+    def _is_header_row(cells: List[Optional[str]], expected_lower: List[str]) -> bool:
+        """Check whether parsed row cells hold the (lowercased) expected headers."""
+        if len(cells) < len(expected_lower):
+            return False
+
+        # Check if this row contains our expected headers
+        row_headers = {str(cell).lower() if cell else "" for cell in cells}
+
+        # Count exact matches first; most rows are decided here
+        exact_matches = sum(1 for expected in expected_lower if expected in row_headers)
+        if exact_matches >= len(expected_lower) * 0.8:
+            return True
+
+        # Count partial matches
+        partial_matches = sum(
+            1
+            for expected in expected_lower
+            if any(
+                expected in actual or actual in expected
+                for actual in row_headers
+                if actual
+            )
+        )
 
-        return None
+        # Good partial matches also make this our header row
+        return partial_matches >= len(expected_lower) * 0.7
 
     def _parse_row_cells(self, row: ET.Element) -> List[Optional[str]]:
         """
@@ -271,23 +404,23 @@ class SpreadsheetMLParser:
             List of cell values (None for empty cells)
         """
         cells = []
-        current_col = 0
-
-        for cell in row.findall("ss:Cell", self.ns):
-            # Check if cell has an Index attribute (sparse cells)
-            index = cell.get(f'{{{self.ns["ss"]}}}Index')
+        cells_append = cells.append
+        index_attr = self._INDEX
+        data_tag = self._DATA
+
+        for cell in row.findall(self._CELL):
+            # Check if cell has an Index attribute (sparse cells); the common
+            # contiguous cell goes straight to the value
+            index = cell.get(index_attr)
             if index:
-                target_col = int(index) - 1  # Convert to 0-based
-                # Fill gaps with None
-                while current_col < target_col:
-                    cells.append(None)
-                    current_col += 1
+                gap = int(index) - 1 - len(cells)  # Convert to 0-based
+                if gap > 0:
+                    # Fill gaps with None
+                    cells.extend([None] * gap)
 
             # Get cell data
-            data_elem = cell.find("ss:Data", self.ns)
-            cell_value = data_elem.text if data_elem is not None else None
-            cells.append(cell_value)
-            current_col += 1
+            data_elem = cell.find(data_tag)
+            cells_append(data_elem.text if data_elem is not None else None)
 
         return cells
 
@@ -319,37 +452,28 @@ class SpreadsheetMLParser:
                 "sap_field": "SAP Field",
             }
 
-        # Find the worksheet
-        worksheet = self.find_worksheet(worksheet_name)
-        if worksheet is None:
-            raise ValueError(f"Worksheet '{worksheet_name}' not found")
-
-        # Find header row
+        # Stream the worksheet's rows: rows before the header row are only
+        # checked for being the header, rows after it are parsed as fields
         expected_headers = list(header_config.values())
-        header_row_idx = self.find_header_row(worksheet, expected_headers)
-        if header_row_idx is None:
-            raise ValueError(
-                f"Header row not found with expected headers: {expected_headers}"
-            )
-
-        # Get all rows
-        rows = worksheet.findall(".//ss:Row", self.ns)
-        header_row = rows[header_row_idx]
-        header_cells = self._parse_row_cells(header_row)
-
-        # Create column index mapping
-        col_mapping = {}
-        for logical_name, expected_text in header_config.items():
-            for idx, cell_value in enumerate(header_cells):
-                if cell_value and expected_text.lower() in cell_value.lower():
-                    col_mapping[logical_name] = idx
-                    break
-
-        # Parse data rows
+        expected_lower = [h.lower() for h in expected_headers]
+        col_mapping = None
         target_fields = []
-        for row in rows[header_row_idx + 1 :]:
+        for row in self._iter_worksheet_rows(worksheet_name):
             cells = self._parse_row_cells(row)
 
+            if col_mapping is None:
+                if not self._is_header_row(cells, expected_lower):
+                    continue
+
+                # Create column index mapping
+                col_mapping = {}
+                for logical_name, expected_text in header_config.items():
+                    for idx, cell_value in enumerate(cells):
+                        if cell_value and expected_text.lower() in cell_value.lower():
+                            col_mapping[logical_name] = idx
+                            break
+                continue
+
             # Skip empty rows
             if not any(cell for cell in cells if cell and str(cell).strip()):
                 continue
@@ -382,6 +506,11 @@ class SpreadsheetMLParser:
 
             target_fields.append(field_data)
 
+        if col_mapping is None:
+            raise ValueError(
+                f"Header row not found with expected headers: {expected_headers}"
+            )
+
         return target_fields
 
 
@@ -8,6 +8,7 @@ with embedded JSON data, inline CSS/JS, and client-side UI features.
 
 import json
 import re
+from dataclasses import fields, is_dataclass
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -39,6 +40,11 @@ def ensure_json_serializable(obj: Any) -> Any:
         return float(obj)
     elif isinstance(obj, np.ndarray):
         return obj.tolist()
+    elif is_dataclass(obj) and not isinstance(obj, type):
+        # Slotted dataclasses have no __dict__
+        return ensure_json_serializable(
+            {f.name: getattr(obj, f.name) for f in fields(obj)}
+        )
     elif hasattr(obj, "__dict__"):
         return ensure_json_serializable(obj.__dict__)
     elif isinstance(obj, (str, int, float, bool)) or obj is None:
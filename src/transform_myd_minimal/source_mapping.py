@@ -15,6 +15,7 @@ from .fuzzy import FieldNormalizer, FuzzyConfig, FuzzyMatcher
 from .logging_config import get_logger
 from .parsers import parse_source_and_targets
 from .synonym import SynonymMatcher
+from .yaml_utils import dump_yaml
 
 # Initialize logger for this module
 logger = get_logger(__name__)
@@ -69,7 +70,68 @@ class SourceBasedMatcher:
         # Track which targets have been matched to avoid duplicates
         matched_targets = set()
 
-        for source_header in source_headers:
+        config = self.fuzzy_config
+        if config.enabled:
+            import numpy as np
+
+            normalize = self.normalizer.normalize_field_name
+            jaro_winkler = self.fuzzy_matcher.jaro_winkler_similarity
+
+            # Normalize every source header and target value once; each target
+            # keeps (priority_field, normalized value, matrix column) entries
+            source_norms = [normalize(header) for header in source_headers]
+            target_sap_field_norms = [
+                normalize(target.get("sap_field", "")) for target in target_fields
+            ]
+            targets_by_sap_field_norm = {}
+            for position, sap_field_norm in enumerate(target_sap_field_norms):
+                targets_by_sap_field_norm.setdefault(sap_field_norm, []).append(
+                    position
+                )
+            value_columns = {}
+            target_values = []
+            entry_positions = []  # (target position, column) per value entry
+            entry_columns = []
+            for position, target in enumerate(target_fields):
+                values = []
+                for priority_field in priority_fields:
+                    target_value = target.get(priority_field, "")
+                    if not target_value:
+                        continue
+                    target_norm = normalize(target_value)
+                    column = value_columns.setdefault(target_norm, len(value_columns))
+                    values.append((priority_field, target_norm, column))
+                    entry_positions.append(position)
+                    entry_columns.append(column)
+                target_values.append(values)
+            entry_positions = np.array(entry_positions, dtype=np.intp)
+            entry_columns = np.array(entry_columns, dtype=np.intp)
+
+            # Levenshtein scores for all pairs in one batch call, and from the
+            # Jaro-Winkler bounds an upper bound of every weighted score (the
+            # margin absorbs float rounding; a negative Jaro-Winkler weight
+            # leaves no bound). Exact Jaro-Winkler scores are only computed
+            # for pairs whose bound can still pass.
+            distinct_values = list(value_columns)
+            shape = (len(source_norms), len(distinct_values))
+            if config.use_levenshtein:
+                lev_matrix = self.fuzzy_matcher.levenshtein_similarity_matrix(
+                    source_norms, distinct_values
+                )
+            upper_matrix = None
+            if not config.use_jaro_winkler or config.jaro_winkler_weight >= 0:
+                upper_matrix = np.zeros(shape, dtype=np.float64)
+                if config.use_levenshtein:
+                    upper_matrix += lev_matrix * config.levenshtein_weight
+                if config.use_jaro_winkler:
+                    jw_bound_matrix = self.fuzzy_matcher.jaro_winkler_bound_matrix(
+                        source_norms, distinct_values
+                    )
+                    upper_matrix += (jw_bound_matrix + 1e-9) * (
+                        config.jaro_winkler_weight
+                    )
+
+        for source_index, source_header in enumerate(source_headers):
             best_match = None
             best_confidence = 0.0
             match_type = "no_match"
@@ -90,17 +152,37 @@ class SourceBasedMatcher:
                         break
 
             # If no exact match, try fuzzy matching
-            if not best_match and self.fuzzy_config.enabled:
-                source_norm = self.normalizer.normalize_field_name(source_header)
-
-                for target in target_fields:
+            if not best_match and config.enabled:
+                source_norm = source_norms[source_index]
+                source_synonyms = self.synonym_matcher.synonyms_of(source_norm)
+                if config.use_levenshtein:
+                    lev_row = lev_matrix[source_index].tolist()
+
+                # Blocking: only synonym targets and targets with a value whose
+                # bound reaches the threshold can change the outcome, so the
+                # others are skipped without visiting them
+                if upper_matrix is None:
+                    candidates = range(len(target_fields))
+                else:
+                    upper_row = upper_matrix[source_index]
+                    passing = upper_row[entry_columns] >= config.threshold
+                    candidates = set(entry_positions[passing].tolist())
+                    for norm in source_synonyms | {source_norm}:
+                        candidates.update(targets_by_sap_field_norm.get(norm, ()))
+                    candidates = sorted(candidates)
+                    upper_row = upper_row.tolist()
+
+                for position in candidates:
+                    target = target_fields[position]
+                    sap_field_norm = target_sap_field_norms[position]
                     target_key = target["transformer_id"]
                     if target_key in matched_targets:
                         continue
 
                     # Check synonym match first
-                    if self.synonym_matcher.is_synonym_match(
-                        source_header, target.get("sap_field", "")
+                    if (
+                        sap_field_norm == source_norm
+                        or sap_field_norm in source_synonyms
                     ) and best_confidence < 0.85:
                         best_match = target
                         best_confidence = 0.85
@@ -108,36 +190,29 @@ class SourceBasedMatcher:
                         match_reason = "Synonym match found"
 
                     # Try fuzzy matching on various target fields
-                    for priority_field in priority_fields:
-                        target_value = target.get(priority_field, "")
-                        if not target_value:
+                    for priority_field, target_norm, column in target_values[position]:
+                        # Skip pairs whose upper bound cannot pass or beat the best
+                        if upper_matrix is not None and (
+                            upper_row[column] < config.threshold
+                            or upper_row[column] <= best_confidence
+                        ):
                             continue
 
-                        target_norm = self.normalizer.normalize_field_name(target_value)
-
                         # Calculate fuzzy similarity
-                        lev_sim = (
-                            self.fuzzy_matcher.levenshtein_similarity(
-                                source_norm, target_norm
-                            )
-                            if self.fuzzy_config.use_levenshtein
-                            else 0.0
-                        )
+                        lev_sim = lev_row[column] if config.use_levenshtein else 0.0
                         jw_sim = (
-                            self.fuzzy_matcher.jaro_winkler_similarity(
-                                source_norm, target_norm
-                            )
-                            if self.fuzzy_config.use_jaro_winkler
+                            jaro_winkler(source_norm, target_norm)
+                            if config.use_jaro_winkler
                             else 0.0
                         )
 
                         combined_sim = (
-                            lev_sim * self.fuzzy_config.levenshtein_weight
-                            + jw_sim * self.fuzzy_config.jaro_winkler_weight
+                            lev_sim * config.levenshtein_weight
+                            + jw_sim * config.jaro_winkler_weight
                         )
 
                         if (
-                            combined_sim >= self.fuzzy_config.threshold
+                            combined_sim >= config.threshold
                             and combined_sim > best_confidence
                         ):
                             best_match = target
@@ -200,13 +275,14 @@ def generate_targets_yaml(
         target_fields: List of target field dictionaries
         output_path: Path to write the targets.yaml file
     """
-    from datetime import datetime
+    import time
 
-    import yaml
+    # One timestamp for both the metadata and the header comment
+    generated_at = time.strftime("%Y-%m-%d %H:%M:%S")
 
     targets_data = {
         "metadata": {
-            "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "generated_at": generated_at,
             "total_fields": len(target_fields),
             "generator": "transform-myd-minimal source-based mapping",
         },
@@ -238,8 +314,8 @@ def generate_targets_yaml(
     # Write YAML file
     with open(output_path, "w", encoding="utf-8") as f:
         f.write("# Target fields metadata generated by transform-myd-minimal\n")
-        f.write(f"# Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        yaml.dump(targets_data, f, default_flow_style=False, allow_unicode=True)
+        f.write(f"# Generated at: {generated_at}\n\n")
+        f.write(dump_yaml(targets_data))
 
     logger.info(f"Generated targets.yaml: {output_path}")
 
@@ -252,24 +328,19 @@ def generate_mapping_yaml(mapping_result: Dict[str, Any], output_path: Path) ->
         mapping_result: Result from source-based matching
         output_path: Path to write the mapping.yaml file
     """
-    from datetime import datetime
+    import time
 
-    import yaml
+    # One timestamp for both the metadata and the header comment
+    generated_at = time.strftime("%Y-%m-%d %H:%M:%S")
 
-    mapping_data = {
-        "metadata": {
-            "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "generator": "transform-myd-minimal source-based mapping",
-            "stats": mapping_result["stats"],
-        },
-        "mappings": [],
-        "unmatched_sources": [],
-        "unmatched_targets": [],
+    # Each section's records are built straight from the matcher result
+    metadata = {
+        "generated_at": generated_at,
+        "generator": "transform-myd-minimal source-based mapping",
+        "stats": mapping_result["stats"],
     }
-
-    # Add successful mappings
-    for match in mapping_result["matches"]:
-        mapping_entry = {
+    mappings = [
+        {
             "source": match["source"],
             "internal_id": match["internal_id"],
             "transformer_id": match["transformer_id"],
@@ -279,73 +350,44 @@ def generate_mapping_yaml(mapping_result: Dict[str, Any], output_path: Path) ->
             "sap_table": match["target_info"]["sap_table"],
             "sap_field": match["target_info"]["sap_field"],
         }
-        mapping_data["mappings"].append(mapping_entry)
-
-    # Add unmatched sources
-    for unmatched in mapping_result["unmatched_sources"]:
-        mapping_data["unmatched_sources"].append(
-            {"source": unmatched["source"], "reason": unmatched["reason"]}
-        )
-
-    # Add unmatched targets
-    for target in mapping_result["unmatched_targets"]:
-        mapping_data["unmatched_targets"].append(
-            {
-                "internal_id": target["internal_id"],
-                "transformer_id": target["transformer_id"],
-                "description": target.get("description", ""),
-                "sap_table": target["sap_table"],
-                "sap_field": target["sap_field"],
-            }
-        )
+        for match in mapping_result["matches"]
+    ]
+    unmatched_sources = [
+        {"source": unmatched["source"], "reason": unmatched["reason"]}
+        for unmatched in mapping_result["unmatched_sources"]
+    ]
+    unmatched_targets = [
+        {
+            "internal_id": target["internal_id"],
+            "transformer_id": target["transformer_id"],
+            "description": target.get("description", ""),
+            "sap_table": target["sap_table"],
+            "sap_field": target["sap_field"],
+        }
+        for target in mapping_result["unmatched_targets"]
+    ]
 
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write YAML file with custom formatting for better readability
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(
-            "# Source-to-target field mappings generated by transform-myd-minimal\n"
-        )
-        f.write(f"# Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(
-            f"# Coverage: {mapping_result['stats']['coverage_percentage']:.1f}%\n\n"
-        )
+    # Build the header comment and every section up front, then write the
+    # file in one go (an empty line follows each section but
+    # unmatched_targets)
+    parts = [
+        "# Source-to-target field mappings generated by transform-myd-minimal\n"
+        f"# Generated at: {generated_at}\n"
+        f"# Coverage: {mapping_result['stats']['coverage_percentage']:.1f}%\n\n"
+    ]
+    sections = [{"metadata": metadata}, {"mappings": mappings}]
+    if unmatched_sources:
+        sections.append({"unmatched_sources": unmatched_sources})
+    for section in sections:
+        parts += [dump_yaml(section), "\n"]
+    if unmatched_targets:
+        parts.append(dump_yaml({"unmatched_targets": unmatched_targets}))
 
-        # Write metadata section
-        metadata_data = {"metadata": mapping_data["metadata"]}
-        yaml.dump(metadata_data, f, default_flow_style=False, allow_unicode=True)
-        f.write("\n")  # Add empty line after metadata
-
-        # Write mappings section
-        mappings_section = {"mappings": mapping_data["mappings"]}
-        yaml.dump(mappings_section, f, default_flow_style=False, allow_unicode=True)
-        f.write("\n")  # Add empty line after mappings
-
-        # Write unmatched sources section
-        if mapping_data["unmatched_sources"]:
-            unmatched_sources_section = {
-                "unmatched_sources": mapping_data["unmatched_sources"]
-            }
-            yaml.dump(
-                unmatched_sources_section,
-                f,
-                default_flow_style=False,
-                allow_unicode=True,
-            )
-            f.write("\n")  # Add empty line after unmatched_sources
-
-        # Write unmatched targets section
-        if mapping_data["unmatched_targets"]:
-            unmatched_targets_section = {
-                "unmatched_targets": mapping_data["unmatched_targets"]
-            }
-            yaml.dump(
-                unmatched_targets_section,
-                f,
-                default_flow_style=False,
-                allow_unicode=True,
-            )
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write("".join(parts))
 
     logger.info(f"Generated mapping.yaml: {output_path}")
 
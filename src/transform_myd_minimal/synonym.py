@@ -9,7 +9,8 @@ Contains all logic and dictionary for synonym matching including:
 - Synonym lookup and matching algorithms
 """
 
-from typing import List
+from functools import cache
+from typing import Dict, FrozenSet, List, Tuple
 
 from .fuzzy import FieldNormalizer
 
@@ -80,6 +81,42 @@ class SynonymMatcher:
 
         return list(set(synonyms))
 
+    @classmethod
+    @cache
+    def synonym_pairs(cls) -> FrozenSet[Tuple[str, str]]:
+        """
+        All (term, synonym) pairs of normalized terms, in both directions.
+
+        Only normalized dictionary keys and values have synonyms, so the pairs
+        are derived from find_synonyms once per class. Extend SYNONYMS before
+        the first match call.
+        """
+        terms = set()
+        for key, values in cls.SYNONYMS.items():
+            terms.add(FieldNormalizer.normalize_field_name(key))
+            terms.update(FieldNormalizer.normalize_field_name(v) for v in values)
+
+        pairs = set()
+        for term in terms:
+            for synonym in cls.find_synonyms(term):
+                pairs.add((term, synonym))
+                pairs.add((synonym, term))
+        return frozenset(pairs)
+
+    @classmethod
+    @cache
+    def synonym_index(cls) -> Dict[str, FrozenSet[str]]:
+        """Normalized term -> its normalized synonyms, built from synonym_pairs."""
+        index = {}
+        for term, synonym in cls.synonym_pairs():
+            index.setdefault(term, set()).add(synonym)
+        return {term: frozenset(synonyms) for term, synonyms in index.items()}
+
+    @classmethod
+    def synonyms_of(cls, term_normalized: str) -> FrozenSet[str]:
+        """Normalized synonyms of an already normalized term."""
+        return cls.synonym_index().get(term_normalized, frozenset())
+
     @classmethod
     def is_synonym_match(cls, term1: str, term2: str) -> bool:
         """Check if two terms are synonyms."""
@@ -89,7 +126,4 @@ class SynonymMatcher:
         if term1_norm == term2_norm:
             return True
 
-        synonyms1 = cls.find_synonyms(term1)
-        synonyms2 = cls.find_synonyms(term2)
-
-        return term2_norm in synonyms1 or term1_norm in synonyms2
+        return (term1_norm, term2_norm) in cls.synonym_pairs()
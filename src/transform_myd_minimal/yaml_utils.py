@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Shared YAML loading and dumping helpers for transform-myd-minimal.
+
+Picks the libyaml-backed safe loader and dumper when PyYAML was built with
+it and provides the block-style, alias-free dumper used for generated YAML.
+"""
+
+from typing import Any
+
+import yaml
+
+# Prefer the libyaml-backed loader and dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover - libyaml not available
+    from yaml import SafeDumper as YamlDumper
+    from yaml import SafeLoader as YamlLoader
+
+__all__ = ["NoAliasDumper", "YamlDumper", "YamlLoader", "dump_yaml"]
+
+
+class NoAliasDumper(YamlDumper):
+    """Safe dumper that writes repeated objects in full instead of as aliases.
+
+    Generated YAML is plain data, so skipping the per-node identity
+    bookkeeping behind anchors/aliases costs nothing and keeps every record
+    readable.
+    """
+
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
+
+
+def dump_yaml(data: Any, **kwargs: Any) -> str:
+    """Serialize data to block-style YAML text with the no-alias safe dumper."""
+    return yaml.dump(
+        data,
+        Dumper=NoAliasDumper,
+        allow_unicode=True,
+        default_flow_style=False,
+        **kwargs,
+    )
@@ -5,6 +5,7 @@ from transform_myd_minimal.main import (
     SkipRule,
     apply_central_memory_to_unmapped_fields,
     apply_field_descriptions_from_central_memory,
+    load_central_mapping_memory,
 )
 
 
@@ -123,3 +124,39 @@ def test_no_central_memory():
         mapping_result, None, "m140", "bnka"
     )
     assert result == mapping_result
+
+
+def test_load_central_mapping_memory_uses_and_refreshes_cache(tmp_path):
+    """The in-process cache is reused, and a YAML edit invalidates it."""
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    yaml_path = config_dir / "central_mapping_memory.yaml"
+    yaml_path.write_text(
+        "global_skip_fields:\n"
+        "  - source_field: MANDT\n"
+        "    source_description: Client\n"
+        "    skip: true\n"
+        "    comment: audit\n",
+        encoding="utf-8",
+    )
+
+    memory = load_central_mapping_memory(tmp_path)
+    assert [rule.source_field for rule in memory.global_skip_fields] == ["MANDT"]
+    # Nothing derived from the config is written next to it
+    assert sorted(p.name for p in config_dir.iterdir()) == [
+        "central_mapping_memory.yaml"
+    ]
+    assert load_central_mapping_memory(tmp_path) == memory
+    # Within one process the parsed memory itself is shared
+    assert load_central_mapping_memory(tmp_path) is memory
+
+    yaml_path.write_text(
+        "global_skip_fields:\n"
+        "  - source_field: ERDAT\n"
+        "    source_description: Creation Date\n"
+        "    skip: true\n"
+        "    comment: audit\n",
+        encoding="utf-8",
+    )
+    memory = load_central_mapping_memory(tmp_path)
+    assert [rule.source_field for rule in memory.global_skip_fields] == ["ERDAT"]
@@ -85,3 +85,46 @@ def test_missing_command():
         "Transform MYD Minimal" in result.stdout
         or "Transform MYD Minimal" in result.stderr
     )
+
+
+def test_map_skips_up_to_date_mapping(tmp_path):
+    """Test that map without --force skips a mapping.yaml newer than its inputs."""
+    import os
+    import shutil
+
+    repo = Path(__file__).parent.parent
+    (tmp_path / "data" / "01_source").mkdir(parents=True)
+    (tmp_path / "data" / "02_target").mkdir(parents=True)
+    shutil.copy(
+        repo / "data" / "01_source" / "test_bnka.xlsx",
+        tmp_path / "data" / "01_source" / "m140_bnka.xlsx",
+    )
+    shutil.copy(
+        repo / "data" / "02_target" / "m140_bnka.xml",
+        tmp_path / "data" / "02_target" / "m140_bnka.xml",
+    )
+
+    def run(command, *extra):
+        return subprocess.run(
+            [sys.executable, "-m", "transform_myd_minimal", command]
+            + ["--object", "m140", "--variant", "bnka", "--root", str(tmp_path)]
+            + ["--json", "--no-log-file", "--no-html", *extra],
+            capture_output=True,
+            text=True,
+            cwd=tmp_path,
+        )
+
+    for command in ("index_source", "index_target", "map"):
+        assert run(command).returncode == 0
+
+    result = run("map")
+    assert result.returncode == 0
+    assert '"status":"up_to_date"' in result.stdout
+
+    # A newer index makes the existing mapping.yaml stale again
+    mapping_file = tmp_path / "migrations" / "m140" / "bnka" / "mapping.yaml"
+    index_file = mapping_file.with_name("index_target.yaml")
+    mtime_ns = mapping_file.stat().st_mtime_ns + 1_000_000_000
+    os.utime(index_file, ns=(mtime_ns, mtime_ns))
+    assert run("map").returncode == 5
+    assert run("map", "--force").returncode == 0
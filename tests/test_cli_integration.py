@@ -35,12 +35,51 @@ def test_cli_html_flags():
         print(f"✓ {cmd} command has HTML flags")
 
 
+def test_transform_force_html_flag(tmp_path):
+    """Test that piped --json transforms write reports only with --force-html."""
+    import shutil
+
+    repo = Path(__file__).parent.parent
+    for src, dest in [
+        ("data/01_source/test_bnka.xlsx", "data/01_source/m140_bnka.xlsx"),
+        ("data/02_target/m140_bnka.xml", "data/02_target/m140_bnka.xml"),
+        ("data/07_raw/test_bnka.xlsx", "data/07_raw/m140_bnka.xlsx"),
+        (
+            "data/06_template/S_BNKA#FreeText_Mandatory.csv",
+            "data/06_template/S_BNKA#FreeText_Mandatory.csv",
+        ),
+    ]:
+        (tmp_path / dest).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(repo / src, tmp_path / dest)
+
+    def run(command, *extra):
+        # capture_output pipes stdout, so it is not a TTY (machine mode)
+        result = run_command(
+            [command, "--object", "m140", "--variant", "bnka"]
+            + ["--root", str(tmp_path), "--json", "--no-log-file", *extra],
+            cwd=tmp_path,
+        )
+        assert result.returncode == 0, result.stderr
+        return result
+
+    for command in ("index_source", "index_target", "map"):
+        run(command, "--no-html")
+
+    html_dir = tmp_path / "reports"
+    run("transform", "--force", "--html-dir", str(html_dir))
+    assert not html_dir.exists() or not any(html_dir.iterdir())
+
+    run("transform", "--force", "--html-dir", str(html_dir), "--force-html")
+    assert list(html_dir.glob("*.html"))
+
+
 def test_no_html_flag():
     """Test that --no-html flag prevents HTML generation."""
     # This test would need actual data files to work properly
     # For now, just test that the flag is accepted
     result = run_command(
         ["index_source", "--object", "test", "--variant", "test", "--no-html"]
+        + ["--no-log-file"]
     )
     # Command will fail due to missing files, but should not fail due to unknown flag
     assert (
@@ -61,6 +100,7 @@ def test_html_dir_flag():
                 "test",
                 "--html-dir",
                 tmpdir,
+                "--no-log-file",
             ]
         )
         # Command will fail due to missing files, but should not fail due to unknown flag
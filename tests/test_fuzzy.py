@@ -0,0 +1,35 @@
+"""Tests for the fuzzy matching helpers."""
+
+from transform_myd_minimal.fuzzy import FuzzyMatcher
+
+
+def test_jaro_winkler_bound_matrix_is_never_exceeded():
+    """The batch bound must hold for every pair used for pruning."""
+    words = [
+        "",
+        "a",
+        "ab",
+        "ba",
+        "abc",
+        "bank",
+        "banka",
+        "bankl",
+        "klant",
+        "kunde",
+        "martha",
+        "marhta",
+        "dixon",
+        "dicksonx",
+    ]
+    bounds = FuzzyMatcher.jaro_winkler_bound_matrix(words, words)
+    for i, s1 in enumerate(words):
+        for j, s2 in enumerate(words):
+            assert FuzzyMatcher.jaro_winkler_similarity(s1, s2) <= bounds[i, j] + 1e-9
+
+
+def test_jaro_winkler_bound_matrix_edge_cases():
+    """Empty strings follow jaro_winkler_similarity's own edge cases."""
+    bounds = FuzzyMatcher.jaro_winkler_bound_matrix(["", "bank"], ["", "bank"])
+    assert bounds[0, 0] == 1.0
+    assert bounds[0, 1] == 0.0
+    assert bounds[1, 1] == 1.0
@@ -34,6 +34,23 @@ def test_ensure_json_serializable():
     assert result["dict"]["nested_path"] == Path("/nested").as_posix()
 
 
+def test_ensure_json_serializable_slotted_dataclass():
+    """Test that slotted dataclasses (no __dict__) serialize field by field."""
+    from transform_myd_minimal.main import FieldMatchResult
+
+    match = FieldMatchResult(
+        source_field="BANKS",
+        target_field="BANKS",
+        confidence_score=1.0,
+        match_type="exact",
+        reason="test",
+    )
+    result = ensure_json_serializable(match)
+    assert result["source_field"] == "BANKS"
+    assert result["confidence_score"] == 1.0
+    assert result["algorithm"] is None
+
+
 def test_write_html_report_f01():
     """Test HTML report generation for F01 index_source."""
     summary = {
@@ -0,0 +1,35 @@
+"""Tests for the source-based mapping matcher."""
+
+from transform_myd_minimal.source_mapping import SourceBasedMatcher
+
+
+def _target(sap_field, description):
+    return {
+        "sap_field": sap_field,
+        "description": description,
+        "group_name": "",
+        "internal_id": f"BNKA.{sap_field}",
+        "transformer_id": f"S_BNKA#{sap_field}",
+    }
+
+
+def test_match_sources_to_targets_fuzzy_and_synonym():
+    """Test exact, fuzzy and synonym matches with batch-scored similarities."""
+    targets = [
+        _target("BANKL", "Bank Keys"),
+        _target("BANKA", "Name of bank"),
+        _target("KUNNR", "Customer"),
+        _target("CLIENT", "Unrelated"),
+    ]
+
+    result = SourceBasedMatcher().match_sources_to_targets(
+        ["Bank Key", "Name of bnk", "klant", "zzz"], targets
+    )
+
+    by_source = {match["source"]: match for match in result["matches"]}
+    assert by_source["Bank Key"]["transformer_id"] == "S_BNKA#BANKL"
+    assert by_source["Bank Key"]["method"] == "fuzzy"
+    assert by_source["Name of bnk"]["transformer_id"] == "S_BNKA#BANKA"
+    assert by_source["klant"]["transformer_id"] == "S_BNKA#CLIENT"
+    assert by_source["klant"]["method"] == "synonym"
+    assert [item["source"] for item in result["unmatched_sources"]] == ["zzz"]
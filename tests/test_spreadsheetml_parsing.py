@@ -0,0 +1,104 @@
+"""Tests for SpreadsheetML (Excel 2003 XML) target field parsing."""
+
+import shutil
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+from transform_myd_minimal.main import (
+    _iter_field_list_rows,
+    _parse_spreadsheetml_target_fields,
+    _spreadsheetml_rows_to_target_fields,
+)
+
+TARGET_XML = Path(__file__).parent.parent / "data" / "02_target" / "m140_bnka.xml"
+
+
+def test_streamed_fields_match_tree_parsing(tmp_path):
+    """Test that streaming the Field List rows gives the tree-based result."""
+    xml_path = tmp_path / "m140_bnka.xml"
+    shutil.copy(TARGET_XML, xml_path)
+
+    streamed = _parse_spreadsheetml_target_fields(xml_path, "bnka")
+    from_tree = _spreadsheetml_rows_to_target_fields(
+        _iter_field_list_rows(ET.parse(xml_path).getroot()), "bnka"
+    )
+
+    assert streamed
+    assert streamed == from_tree
+    assert [field["field_count"] for field in streamed] == list(
+        range(1, len(streamed) + 1)
+    )
+
+
+def test_missing_field_list_worksheet(tmp_path):
+    """Test that a workbook without a Field List worksheet is rejected."""
+    xml_path = tmp_path / "m140_bnka.xml"
+    xml_path.write_text(
+        TARGET_XML.read_text(encoding="utf-8").replace(
+            'ss:Name="Field List"', 'ss:Name="Other"'
+        ),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ValueError, match="Field List"):
+        _parse_spreadsheetml_target_fields(xml_path, "bnka")
+
+
+def test_read_excel_target_fields_fallback(tmp_path):
+    """Test the XLSX fallback with lowercase headers and empty optional cells."""
+    import pandas as pd
+
+    from transform_myd_minimal.parsers import read_excel_target_fields
+
+    xlsx_path = tmp_path / "m140_bnka.xlsx"
+    pd.DataFrame(
+        {
+            "sap_field": ["BANKL", " BANKA "],
+            "FIELD DESCRIPTION": ["Bank key", "Name of bank"],
+            "Importance": ["Mandatory", "Optional"],
+            "Group Name": ["Key", "data"],
+            "Length": [15, None],
+            "Decimal": [None, 2],
+        }
+    ).to_excel(xlsx_path, sheet_name="Field List", index=False)
+
+    fields = read_excel_target_fields(xlsx_path, "bnka")
+
+    assert [field["sap_field"] for field in fields] == ["BANKL", "BANKA"]
+    assert [field["field_description"] for field in fields] == [
+        "Bank key",
+        "Name of bank",
+    ]
+    assert [field["key"] for field in fields] == [True, False]
+    assert [field["sap_table"] for field in fields] == ["bnka", "bnka"]
+    assert [field["length"] for field in fields] == ["15", ""]
+    assert [field["decimal"] for field in fields] == [None, 2.0]
+    assert [field["field_count"] for field in fields] == [1, 2]
+
+
+def test_spreadsheetml_parser_streams_field_list():
+    """Test that the streamed legacy parser matches the tree-based header row."""
+    from transform_myd_minimal.parsers import SpreadsheetMLParser
+
+    parser = SpreadsheetMLParser(TARGET_XML)
+    fields = parser.parse_target_fields()
+
+    assert fields
+    assert all(field["internal_id"].count(".") == 1 for field in fields)
+    worksheet = parser.find_worksheet("Field List")
+    assert parser.find_header_row(worksheet, ["SAP Field", "SAP Structure"]) is not None
+
+    with pytest.raises(ValueError, match="Worksheet 'Nope' not found"):
+        parser.parse_target_fields("Nope")
+
+
+def test_spreadsheetml_parser_stdlib_fallback(monkeypatch):
+    """Test that the ElementTree fallback parses the same fields as lxml."""
+    from transform_myd_minimal.parsers import SpreadsheetMLParser
+
+    fields = SpreadsheetMLParser(TARGET_XML).parse_target_fields()
+    monkeypatch.setattr(SpreadsheetMLParser, "_USE_LXML", False)
+
+    assert SpreadsheetMLParser(TARGET_XML).parse_target_fields() == fields
@@ -123,6 +123,50 @@ def test_transform_yaml_structure_requirements():
     )
 
 
+def test_update_object_list_appends_new_entries_once(tmp_path):
+    """Test that object_list.yaml gains each object/variant exactly once."""
+    from transform_myd_minimal.main import update_object_list
+
+    for object_name, variant in [("m140", "bnka"), ("m141", "knb1"), ("m140", "bnka")]:
+        update_object_list(object_name, variant, tmp_path)
+
+    object_list_file = tmp_path / "migrations" / "object_list.yaml"
+    with open(object_list_file, encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+
+    assert list(data) == ["entries"]
+    assert [(e["object"], e["variant"]) for e in data["entries"]] == [
+        ("m140", "bnka"),
+        ("m141", "knb1"),
+    ]
+
+
+def test_update_object_list_rewrites_corrupted_file(tmp_path):
+    """Test that a corrupted object_list.yaml is rewritten, not appended to."""
+    from transform_myd_minimal.main import update_object_list
+
+    object_list_file = tmp_path / "migrations" / "object_list.yaml"
+    object_list_file.parent.mkdir(parents=True)
+    object_list_file.write_text("entries:\n- object: [m141\n", encoding="utf-8")
+
+    update_object_list("m140", "bnka", tmp_path)
+
+    with open(object_list_file, encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+    assert [(e["object"], e["variant"]) for e in data["entries"]] == [("m140", "bnka")]
+
+
+def test_dump_yaml_writes_shared_objects_without_aliases():
+    """Test that report YAML repeats shared records instead of aliasing them."""
+    from transform_myd_minimal.yaml_utils import dump_yaml
+
+    record = {"source_field": "BANKL", "target_field": "BANKL"}
+    text = dump_yaml({"mappings": [record, record]})
+
+    assert "&" not in text and "*" not in text
+    assert yaml.safe_load(text) == {"mappings": [record, record]}
+
+
 if __name__ == "__main__":
     # Allow running this test directly
     test_transform_yaml_generation()